@@ -22,8 +22,18 @@
 
 import bpy
 import os  # Used for cached selection saving/loading
+import sys  # Used for interning bone names and measuring cache memory
+import json  # Used for cache library import/export records
+import ast  # Used to safely read sidecar files while scanning the cache library
+import hashlib  # Used for rig fingerprints
+import threading  # Used for background cache library scans
+from concurrent.futures import ThreadPoolExecutor  # Reads library sidecar files in parallel
+from array import array  # Compact storage of cached bone indices
+from collections import OrderedDict  # Least recently used order of the cache registry
+from bisect import bisect_left, bisect_right  # Key frame lookups
 from ntpath import split as ntSplit  # Splits file path into file name and directory
 from bpy.utils import register_class, unregister_class
+from bpy.app.handlers import persistent
 from bpy.props import (StringProperty,
                        BoolProperty,
                        IntProperty,
@@ -36,7 +46,9 @@ from bpy.types import (Panel,
                        Menu,
                        Operator,
                        PropertyGroup,
+                       AddonPreferences,
                        )
+from bpy_extras.io_utils import ImportHelper, ExportHelper
 
 bl_info = {
     "name": "Leet Bone Tools",
@@ -56,6 +68,14 @@ bl_info = {
 #    Toolset Properties
 # ------------------------------------------------------------------------
 
+def SyncNativeSetsUpdate(self, context):
+    # Builds or removes the native keying sets and bone collections when the sync option is toggled
+    if self.SyncNativeSets:
+        SyncNativeSets(context, self)
+    else:
+        ClearNativeSets(context)
+
+
 class LeetBoneToolsSettings(PropertyGroup):
     NumCachePerRow: IntProperty(
         name="Caches Per Row",
@@ -140,6 +160,32 @@ class LeetBoneToolsSettings(PropertyGroup):
         default=True
     )
 
+    ViewCacheKeying: BoolProperty(
+        name="Cache Keying Buttons",
+        description="This will show buttons to key, clear, and reset each cache's bones without changing the selection",
+        default=False
+    )
+
+    JumpKeyAllBones: BoolProperty(
+        name="Jump To Keys On All Bones",
+        description="The cache key jump buttons only stop on frames where every bone in the cache is keyed",
+        default=False
+    )
+
+    ViewCacheKeyStatus: BoolProperty(
+        name="Cache Key Status",
+        description="This will show if each cache's bones are fully, partly, or not keyed on the current frame",
+        default=True
+    )
+
+    SyncNativeSets: BoolProperty(
+        name="Sync Keying Sets/Bone Collections",
+        description="Mirrors each cache into a keying set and a bone collection, so keying and selecting caches is a "
+                    "single native call.  The cached selections stay the source of truth",
+        default=False,
+        update=SyncNativeSetsUpdate
+    )
+
     ViewCursorSnapTools: BoolProperty(
         name="Snap To Cursor Tools",
         description="This will show or hide the go to cursor tools when one bone is selected",
@@ -164,9 +210,374 @@ class LeetBoneToolsSettings(PropertyGroup):
         default=""
     )
 
-    # Non-saved options
-    CachedSelections = {}
-    CachesOrder = {}
+    LibrarySearch: StringProperty(
+        name="Search",
+        description="Only show library caches with this text in their name",
+        default=""
+    )
+
+    # Non-saved options, views of the in session cache registry for the open blend file
+    CachedSelections = None  # Armature name -> LeetRigCacheStore
+    CachesOrder = None  # Armature name -> list of cache names
+
+
+class LeetBoneToolsPreferences(AddonPreferences):
+    bl_idname = __name__
+
+    LibraryRoots: StringProperty(
+        name="Cache Library Folders",
+        description="Folders scanned for saved bone selection caches, separate folders with a semicolon",
+        default=""
+    )
+
+    CacheMemoryLimit: IntProperty(
+        name="Cache Memory Limit (KB)",
+        description="When the cached selections of every blend file opened this session use more memory than this, "
+                    "the least recently used armatures not in the open blend file are saved and unloaded",
+        default=16384,
+        min=0
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "LibraryRoots")
+        layout.prop(self, "CacheMemoryLimit")
+
+
+# ------------------------------------------------------------------------
+#    Compact Cached Selection Storage
+# ------------------------------------------------------------------------
+
+class LeetRigCacheStore:
+    """
+    Compact in memory store of the cached bone selections for a single armature.
+    Every bone name is kept once in the rig's name table, a single string sliced by an array of offsets.  All caches
+    share one sorted array of indices into that table, each cache is a span of it found with an array of offsets.
+    Reading a cache by name returns the list of bone names like the old nested dicts did.
+    """
+    __slots__ = ("BoneNames", "NameOffsets", "CacheSlots", "CacheOffsets", "Indices")
+
+    def __init__(self, caches: dict = None):
+        self.BoneNames = ""  # Every bone name joined together
+        self.NameOffsets = array('L', [0])  # Index -> start of the bone name, followed by the end of the last name
+        self.CacheSlots = {}  # Cache name -> slot of the cache
+        self.CacheOffsets = array('L', [0])  # Slot -> start of the cache's indices, followed by the end of the last
+        self.Indices = array('H')  # Bone indices of every cache, each cache's span is sorted
+        if caches is not None:
+            self.SetCaches(caches)
+
+    def GetBoneName(self, ind: int):
+        offsets = self.NameOffsets
+        return self.BoneNames[offsets[ind]:offsets[ind + 1]]
+
+    def GetBoneCount(self):
+        return len(self.NameOffsets) - 1
+
+    def GetCacheSpan(self, cache_name: str):
+        slot = self.CacheSlots[cache_name]
+        return self.CacheOffsets[slot], self.CacheOffsets[slot + 1]
+
+    def GetCacheSize(self, cache_name: str):
+        # Bone count without decoding the bone names
+        start, end = self.GetCacheSpan(cache_name)
+        return end - start
+
+    def SetCaches(self, caches: dict):
+        """
+        Adds or replaces caches, the name table is only mapped back to indices once for all of them.
+        :param caches: Dict of cache name -> bone names.
+        """
+        indices = {self.GetBoneName(i): i for i in range(self.GetBoneCount())}
+        new_names = []
+        for cache_name, bone_names in caches.items():
+            bone_names = list(bone_names)
+            for i in bone_names:
+                if i not in indices:
+                    indices[i] = len(indices)
+                    new_names.append(i)
+                    self.NameOffsets.append(self.NameOffsets[-1] + len(i))
+            if len(indices) > 0x10000 and self.Indices.typecode == 'H':
+                self.Indices = array('L', self.Indices)
+            self.SetSpan(cache_name, sorted(set(indices[i] for i in bone_names)))
+        if new_names:
+            self.BoneNames += "".join(new_names)
+
+    def SetSpan(self, cache_name: str, indices):
+        # Replaces the indices of a cache, moving the spans after it
+        slot = self.CacheSlots.get(cache_name)
+        if slot is None:
+            slot = self.CacheSlots[sys.intern(cache_name)] = len(self.CacheSlots)
+            self.CacheOffsets.append(self.CacheOffsets[-1])
+        start, end = self.CacheOffsets[slot], self.CacheOffsets[slot + 1]
+        self.Indices[start:end] = array(self.Indices.typecode, indices)
+        shift = len(indices) - (end - start)
+        if shift != 0:
+            for i in range(slot + 1, len(self.CacheOffsets)):
+                self.CacheOffsets[i] += shift
+
+    def ToDict(self):
+        # Plain dict of lists used when saving to disk
+        return {i: self[i] for i in self.CacheSlots}
+
+    def GetMemoryBytes(self):
+        """
+        Approximates the memory used by this store.
+        :return: Tuple of the bytes used by this store, and the bytes the same caches take as lists of bone names.
+        """
+        compact = sys.getsizeof(self) + sys.getsizeof(self.BoneNames) + sys.getsizeof(self.NameOffsets) + \
+                  sys.getsizeof(self.CacheSlots) + sys.getsizeof(self.CacheOffsets) + sys.getsizeof(self.Indices)
+        compact += sum(sys.getsizeof(i) for i in self.CacheSlots)
+
+        # Every cache as a list of bone names, the old sidecar literal shares each unique name string between lists
+        used = set()
+        lists = sys.getsizeof({i: None for i in self.CacheSlots})
+        for i in self.CacheSlots:
+            start, end = self.GetCacheSpan(i)
+            lists += sys.getsizeof(i) + sys.getsizeof([None] * (end - start))
+            used.update(self.Indices[start:end])
+        lists += sum(sys.getsizeof(self.GetBoneName(i)) for i in used)
+        return compact, lists
+
+    def __getitem__(self, cache_name: str):
+        start, end = self.GetCacheSpan(cache_name)
+        return [self.GetBoneName(i) for i in self.Indices[start:end]]
+
+    def __setitem__(self, cache_name: str, bone_names):
+        self.SetCaches({cache_name: bone_names})
+
+    def __delitem__(self, cache_name: str):
+        self.SetSpan(cache_name, ())
+        slot = self.CacheSlots.pop(cache_name)
+        del self.CacheOffsets[slot + 1]
+        for i, j in self.CacheSlots.items():
+            if j > slot:
+                self.CacheSlots[i] = j - 1
+
+    def __contains__(self, cache_name: str):
+        return cache_name in self.CacheSlots
+
+    def __iter__(self):
+        return iter(self.CacheSlots)
+
+    def __len__(self):
+        return len(self.CacheSlots)
+
+    def keys(self):
+        return self.CacheSlots.keys()
+
+    def items(self):
+        return ((i, self[i]) for i in self.CacheSlots)
+
+
+# ------------------------------------------------------------------------
+#    In Session Cache Registry
+# ------------------------------------------------------------------------
+
+class LeetRegistryEntry:
+    __slots__ = ("Store", "Order")
+
+    def __init__(self, store=None, order=None):
+        self.Store = store if store is not None else LeetRigCacheStore()
+        self.Order = order if order is not None else []
+
+
+class LeetCacheRegistry:
+    """
+    In session registry of the cached selections, keyed by blend file and armature so caches never leak between files.
+    Armatures are kept in least recently used order, when the registry is over the memory limit set in the add-on
+    preferences the armatures that are not in the open blend file are saved to their sidecar file and dropped.
+    Dropped armatures are loaded again the next time they are used.
+    """
+    __slots__ = ("Entries", "Evicted", "SidecarPaths")
+
+    def __init__(self):
+        self.Entries = OrderedDict()  # (blend path, armature name) -> LeetRegistryEntry, least recently used first
+        self.Evicted = {}  # (blend path, armature name) -> sidecar path the armature was saved to
+        self.SidecarPaths = {}  # Blend path -> sidecar path last saved or loaded
+
+    def Get(self, key):
+        entry = self.Entries.get(key)
+        if entry is None and key in self.Evicted:
+            entry = self.Reload(key)
+        if entry is not None:
+            self.Entries.move_to_end(key)
+        return entry
+
+    def GetOrCreate(self, key):
+        entry = self.Get(key)
+        if entry is None:
+            entry = self.Entries[key] = LeetRegistryEntry()
+        return entry
+
+    def Delete(self, key):
+        self.Entries.pop(key, None)
+        self.Evicted.pop(key, None)
+
+    def DeletePath(self, blend_path: str):
+        # Drops every armature of a blend file
+        for key in [i for i in self.Entries if i[0] == blend_path]:
+            del self.Entries[key]
+        for key in [i for i in self.Evicted if i[0] == blend_path]:
+            del self.Evicted[key]
+
+    def MovePath(self, old_path: str, new_path: str):
+        """
+        Moves the armatures of a blend file to the path it was saved to, keeping their least recently used order.
+        :param old_path: The path of the blend file before saving, empty if it was never saved.
+        :param new_path: The path the blend file was saved to, armatures already under it are replaced.
+        """
+        if old_path == new_path:
+            return
+        self.DeletePath(new_path)
+        if old_path != "" and old_path in self.SidecarPaths:
+            self.SidecarPaths[new_path] = self.SidecarPaths[old_path]
+        else:
+            # The replaced file's sidecar does not hold these caches
+            self.SidecarPaths.pop(new_path, None)
+        self.Entries = OrderedDict(((new_path, i[1]) if i[0] == old_path else i, j) for i, j in self.Entries.items())
+        self.Evicted = {(new_path, i[1]) if i[0] == old_path else i: j for i, j in self.Evicted.items()}
+
+    def GetArmNames(self, blend_path: str):
+        # Only the loaded armatures, so listing caches never reloads dropped armatures
+        return [i[1] for i in self.Entries if i[0] == blend_path]
+
+    def GetSidecarPath(self, blend_path: str):
+        # The sidecar the blend file's caches were last saved to or loaded from, None if they never were
+        return self.SidecarPaths.get(blend_path)
+
+    def Reload(self, key):
+        path = self.Evicted.pop(key)
+        try:
+            caches, order, fingerprints = ReadSidecar(path)
+        except (OSError, ValueError, SyntaxError, TypeError, IndexError):
+            print("Could not reload cached selections:")
+            print(path)
+            return None
+
+        arm = key[1]
+        if arm not in caches:
+            return None
+        entry = self.Entries[key] = LeetRegistryEntry(LeetRigCacheStore(caches[arm]),
+                                                      [sys.intern(i) for i in order.get(arm, caches[arm].keys())])
+        return entry
+
+    def Trim(self, limit_bytes: int, blend_path: str, present_arms):
+        """
+        Drops the least recently used armatures until the registry is under the memory limit.
+        :param limit_bytes: The memory limit in bytes.
+        :param blend_path: The path of the open blend file.
+        :param present_arms: Set of the armature names in the open blend file, these are never dropped.
+        :return: The number of armatures dropped.
+        """
+        sizes = {i: j.Store.GetMemoryBytes()[0] + sys.getsizeof(j.Order) for i, j in self.Entries.items()}
+        total = sum(sizes.values())
+        count = 0
+        for key in list(self.Entries.keys()):
+            if total <= limit_bytes:
+                break
+            if key[0] == blend_path and key[1] in present_arms:
+                continue
+
+            # Caches the user never saved or loaded have no sidecar of their own, and are never written for them
+            path = self.GetSidecarPath(key[0])
+            if key[0] == "" or path is None:
+                continue
+
+            entry = self.Entries[key]
+            try:
+                WriteSidecar(path, {key[1]: entry.Store}, {key[1]: entry.Order}, {})
+            except OSError:
+                print("Could not save cached selections:")
+                print(path)
+                continue
+
+            del self.Entries[key]
+            self.Evicted[key] = path
+            total -= sizes[key]
+            count += 1
+        return count
+
+
+class LeetRegistryView:
+    """
+    Dict like view of the registry for the open blend file, keyed by armature name.
+    LeetBoneToolsSettings.CachedSelections views the cache stores and CachesOrder views the cache orders.
+    """
+    __slots__ = ("Registry", "Field")
+
+    def __init__(self, registry, field: str):
+        self.Registry = registry
+        self.Field = field
+
+    def __getitem__(self, arm_name: str):
+        entry = self.Registry.Get((bpy.data.filepath, arm_name))
+        if entry is None:
+            raise KeyError(arm_name)
+        return getattr(entry, self.Field)
+
+    def __setitem__(self, arm_name: str, value):
+        setattr(self.Registry.GetOrCreate((bpy.data.filepath, arm_name)), self.Field, value)
+
+    def __delitem__(self, arm_name: str):
+        self.Registry.Delete((bpy.data.filepath, arm_name))
+
+    def __contains__(self, arm_name: str):
+        return self.Registry.Get((bpy.data.filepath, arm_name)) is not None
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def get(self, arm_name: str, default=None):
+        entry = self.Registry.Get((bpy.data.filepath, arm_name))
+        return default if entry is None else getattr(entry, self.Field)
+
+    def keys(self):
+        return self.Registry.GetArmNames(bpy.data.filepath)
+
+    def items(self):
+        return [(i, self[i]) for i in self.keys()]
+
+
+CacheRegistry = LeetCacheRegistry()
+LeetBoneToolsSettings.CachedSelections = LeetRegistryView(CacheRegistry, "Store")
+LeetBoneToolsSettings.CachesOrder = LeetRegistryView(CacheRegistry, "Order")
+
+
+def TrimCacheRegistry():
+    # Drops armatures from the registry when it is over the memory limit
+    prefs = GetAddonPreferences()
+    limit = prefs.CacheMemoryLimit if prefs is not None else 16384
+    present = set(i.name for i in bpy.data.objects if i.type == 'ARMATURE')
+    return CacheRegistry.Trim(limit * 1024, bpy.data.filepath, present)
+
+
+SavingBlendPath = None  # Path of the blend file before the save in progress
+
+
+@persistent
+def LeetCacheRegistryTrim(*args):
+    # Caches of a never saved file have no sidecar to come back from, so they are gone once another file is opened
+    CacheRegistry.DeletePath("")
+    # Armatures of the last blend file are dropped first after opening another file
+    TrimCacheRegistry()
+
+
+@persistent
+def LeetCacheRegistrySavePre(*args):
+    global SavingBlendPath
+    SavingBlendPath = bpy.data.filepath
+
+
+@persistent
+def LeetCacheRegistrySavePost(*args):
+    # The registry is keyed by blend path, so the caches follow the file when it is first saved or saved as
+    global SavingBlendPath
+    if SavingBlendPath is not None:
+        CacheRegistry.MovePath(SavingBlendPath, bpy.data.filepath)
+    SavingBlendPath = None
 
 
 # ------------------------------------------------------------------------
@@ -189,6 +600,1113 @@ def GetCWDAndFileName(share_setting_with_folder: bool = False):
     return cwd, file_name
 
 
+def WriteSidecar(file_path: str, stores, orders, fingerprints):
+    """
+    Saves armatures' caches to a sidecar file, keeping the armatures already in the file that are not being saved.
+    :param file_path: The sidecar file path.
+    :param stores: Dict of armature name -> LeetRigCacheStore.
+    :param orders: Dict of armature name -> list of cache names.
+    :param fingerprints: Dict of armature name -> rig fingerprint.
+    """
+    caches, order, prints = {}, {}, {}
+    if os.path.exists(file_path):
+        try:
+            caches, order, prints = ReadSidecar(file_path)
+        except (OSError, ValueError, SyntaxError, TypeError, IndexError):
+            print("Replacing unreadable cached selections:")
+            print(file_path)
+
+    caches.update((i, j.ToDict()) for i, j in stores.items())
+    order.update(orders)
+    prints.update(fingerprints)
+    with open(file_path, 'w') as saveFile:
+        saveFile.write(str([caches, order, prints]))
+
+
+def GetAddonPreferences():
+    # The add-on preferences, or None when this file is run as a script instead of installed
+    addon = bpy.context.preferences.addons.get(__name__)
+    return addon.preferences if addon is not None else None
+
+
+def GetUniqueCacheName(store, cache_name: str):
+    # Adds a numbered suffix to the cache name until it is not used on this armature
+    n = 1
+    new_name = cache_name
+    while new_name in store:
+        new_name = "{}.{:03d}".format(cache_name, n)
+        n += 1
+    return new_name
+
+
+def MergeCacheRecord(bone_tools, arm_name: str, cache_name: str, bone_names, conflict: str = 'SKIP'):
+    """
+    Merges a single cache into an armature's cached selections.
+    :param bone_tools: The scene's leet bone tools settings.
+    :param arm_name: The name of the armature to add the cache to.
+    :param cache_name: The name of the cache to add.
+    :param bone_names: The bone names in the cache.
+    :param conflict: What to do when the armature already has this cache, one of SKIP, OVERWRITE, or RENAME.
+    :return: The name the cache was saved as, or None if it was skipped.
+    """
+    store = GetRigCacheStore(bone_tools, arm_name)
+    if cache_name in store:
+        if conflict == 'SKIP':
+            return None
+        elif conflict == 'RENAME':
+            cache_name = GetUniqueCacheName(store, cache_name)
+
+    is_new = cache_name not in store
+    store[cache_name] = bone_names
+    if is_new:
+        bone_tools.CachesOrder[arm_name].append(sys.intern(cache_name))
+    return cache_name
+
+
+def WriteCacheRecords(file, bone_tools, arm_names):
+    # Writes one line delimited json record per cache, in each armature's cache order
+    count = 0
+    for arm in arm_names:
+        store = bone_tools.CachedSelections.get(arm)
+        if store is None:
+            continue
+        for i in bone_tools.CachesOrder.get(arm, ()):
+            if i in store:
+                file.write(json.dumps({"armature": arm, "cache": i, "bones": store[i]}) + "\n")
+                count += 1
+    return count
+
+
+def ReadCacheRecords(file):
+    # Yields (armature, cache, bones) one line at a time so large libraries are never fully loaded
+    for line in file:
+        line = line.strip()
+        if line == "":
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict) or not isinstance(record.get("armature"), str) or \
+                not isinstance(record.get("cache"), str) or not IsNameList(record.get("bones")):
+            print("Skipping invalid cache record:")
+            print(line)
+            continue
+        yield record["armature"], record["cache"], record["bones"]
+
+
+# ------------------------------------------------------------------------
+#    Armature Helper Functions
+# ------------------------------------------------------------------------
+
+def GetPoseArmatures(context):
+    """
+    Gets every armature in pose mode, so multi-object pose mode can be processed as one batch per armature.
+    :param context: The current blender context.
+    :return: List of the armature objects in pose mode, with the active object first.
+    """
+    active = context.object
+    arms = [active] if active is not None and active.type == 'ARMATURE' else []
+    for obj in context.objects_in_mode or ():
+        if obj.type == 'ARMATURE' and obj != active:
+            arms.append(obj)
+    return arms
+
+
+def GetRigFingerprint(obj):
+    # Identifies a rig by its bone names, so caches can be matched to the same rig in other blend files
+    return hashlib.sha1("\n".join(sorted(obj.data.bones.keys())).encode()).hexdigest()
+
+
+RigInfos = {}  # Armature data name -> (rig fingerprint, frozenset of bone names)
+
+
+def GetRigInfo(obj):
+    # The rig fingerprint and bone names, only worked out again after the armature's bones change
+    info = RigInfos.get(obj.data.name)
+    if info is None:
+        info = RigInfos[obj.data.name] = (GetRigFingerprint(obj), frozenset(obj.data.bones.keys()))
+    return info
+
+
+@persistent
+def LeetRigInfoUpdate(scene, depsgraph=None):
+    # Forgets the rig info of edited armatures
+    if depsgraph is None:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Armature):
+            RigInfos.pop(update.id.name, None)
+
+
+@persistent
+def LeetRigInfoClear(*args):
+    # Armatures from the last blend file are no longer valid
+    RigInfos.clear()
+
+
+def GroupPoseBonesByArmature(pose_bones):
+    # Groups the pose bones by the armature object they belong to in a single pass
+    groups = {}
+    for b in pose_bones or ():
+        groups.setdefault(b.id_data, []).append(b)
+    return groups
+
+
+def GetRigCacheStore(bone_tools, arm_name: str):
+    # The armature's cache store, an empty store is made for armatures without caches
+    if arm_name not in bone_tools.CachedSelections:
+        bone_tools.CachedSelections[arm_name] = LeetRigCacheStore()
+    if arm_name not in bone_tools.CachesOrder:
+        bone_tools.CachesOrder[arm_name] = []
+    return bone_tools.CachedSelections[arm_name]
+
+
+def GetCacheArmatures(bone_tools, armatures, cache_name: str):
+    # The armatures holding a cache of this name
+    return [i for i in armatures if cache_name in bone_tools.CachedSelections.get(i.name, ())]
+
+
+def GetArmaturesCaches(bone_tools, armatures):
+    """
+    Merges the caches of several armatures for display, caches with the same name span armatures.
+    :param bone_tools: The scene's leet bone tools settings.
+    :param armatures: The armature objects to list the caches of.
+    :return: List of tuples of the cache name and its bone count over all armatures, in cache order.
+    """
+    sizes = {}
+    for obj in armatures:
+        store = bone_tools.CachedSelections.get(obj.name)
+        if store is None:
+            continue
+        for i in bone_tools.CachesOrder.get(obj.name, ()):
+            if i in store:
+                sizes[i] = sizes.get(i, 0) + store.GetCacheSize(i)
+    return list(sizes.items())
+
+
+# ------------------------------------------------------------------------
+#    Bone Keying Helper Functions
+# ------------------------------------------------------------------------
+
+def GetRotationDataPath(pose_bone):
+    # The rotation property used by this bone's rotation mode
+    if pose_bone.rotation_mode == 'QUATERNION':
+        return 'rotation_quaternion'
+    elif pose_bone.rotation_mode == 'AXIS_ANGLE':
+        return 'rotation_axis_angle'
+    return 'rotation_euler'
+
+
+def GetEffectDataPaths(bone_tools, pose_bone, all_rotations: bool = False):
+    """
+    Gets the transform properties of a pose bone effected by the bone keying tools settings.
+    :param bone_tools: The scene's leet bone tools settings.
+    :param pose_bone: The pose bone to get the properties of.
+    :param all_rotations: If true every rotation property is returned instead of just the one for the rotation mode.
+    :return: List of data paths relative to the pose bone.
+    """
+    paths = []
+    if bone_tools.EffectLoc:
+        paths.append('location')
+    if bone_tools.EffectRot:
+        if all_rotations:
+            paths.extend(('rotation_euler', 'rotation_quaternion', 'rotation_axis_angle'))
+        else:
+            paths.append(GetRotationDataPath(pose_bone))
+    if bone_tools.EffectScale:
+        paths.append('scale')
+    return paths
+
+
+def GetCachedPoseBones(obj, bone_names):
+    # Pose bones of the armature for the cached bone names, skipping bones that no longer exist
+    pose_bones = obj.pose.bones
+    return [b for b in (pose_bones.get(i) for i in bone_names) if b is not None]
+
+
+def KeyPoseBones(bone_tools, pose_bones, frame):
+    # Keys the pose bones directly, without going through the selection
+    for b in pose_bones:
+        for path in GetEffectDataPaths(bone_tools, b):
+            b.keyframe_insert(path, frame=frame, group=b.name)
+    UpdateKeyTimeIndices(bone_tools, pose_bones)
+
+
+def ClearKeyPoseBones(bone_tools, pose_bones, frame):
+    # Deletes the keys of the pose bones on this frame
+    for b in pose_bones:
+        for path in GetEffectDataPaths(bone_tools, b, all_rotations=True):
+            try:
+                b.keyframe_delete(path, frame=frame)
+            except RuntimeError:
+                # This property was never keyed
+                pass
+    UpdateKeyTimeIndices(bone_tools, pose_bones)
+
+
+def ResetPoseBones(bone_tools, pose_bones):
+    # Resets the pose bones to their rest pose, leaving locked channels alone
+    for b in pose_bones:
+        if bone_tools.EffectLoc:
+            for i in range(3):
+                if not b.lock_location[i]:
+                    b.location[i] = 0.0
+
+        if bone_tools.EffectRot:
+            path = GetRotationDataPath(b)
+            if path == 'rotation_euler':
+                for i in range(3):
+                    if not b.lock_rotation[i]:
+                        b.rotation_euler[i] = 0.0
+            else:
+                rot = getattr(b, path)
+                rest = (1.0, 0.0, 0.0, 0.0) if path == 'rotation_quaternion' else (0.0, 0.0, 1.0, 0.0)
+                if not (b.lock_rotations_4d and b.lock_rotation_w):
+                    rot[0] = rest[0]
+                for i in range(3):
+                    if not b.lock_rotation[i]:
+                        rot[i + 1] = rest[i + 1]
+
+        if bone_tools.EffectScale:
+            for i in range(3):
+                if not b.lock_scale[i]:
+                    b.scale[i] = 1.0
+
+
+# ------------------------------------------------------------------------
+#    Keyframe Time Index
+# ------------------------------------------------------------------------
+
+class LeetKeyTimeIndex:
+    """
+    Index of the key frames of every bone in an action.
+    Each bone maps to the sorted key frames over all of its F-Curves, so checking if a bone is keyed on a frame is a
+    bisect.  After an action changes each F-Curve's key frames are read in a single call, and only the bones whose key
+    frames changed are merged again.
+    The merged key frames of caches are kept too, and are updated frame by frame as their bones' keys change.
+    """
+    __slots__ = ("CurveKeys", "BoneCurves", "BoneKeys", "MergedKeys", "BoneMerged", "Dirty")
+
+    def __init__(self):
+        self.CurveKeys = {}  # (data path, array index) -> key frames of the F-Curve
+        self.BoneCurves = {}  # Bone name -> set of F-Curve keys
+        self.BoneKeys = {}  # Bone name -> sorted array of unique key frames
+        self.MergedKeys = {}  # (bone names, 'ANY' or 'ALL') -> sorted array of key frames
+        self.BoneMerged = {}  # Bone name -> set of merged keys holding the bone
+        self.Dirty = True
+
+    def Update(self, action):
+        # Re-reads the F-Curves of the action, and merges the key frames of the bones that changed
+        seen = set()
+        changed = set()
+        for fc in action.fcurves:
+            bone = GetBoneNameFromDataPath(fc.data_path)
+            if bone is None:
+                continue
+            key = (fc.data_path, fc.array_index)
+            seen.add(key)
+            if self.SetCurveKeys(bone, key, fc):
+                changed.add(bone)
+
+        # F-Curves deleted from the action
+        for key in [i for i in self.CurveKeys if i not in seen]:
+            bone = GetBoneNameFromDataPath(key[0])
+            if self.SetCurveKeys(bone, key, None):
+                changed.add(bone)
+
+        for bone in changed:
+            self.MergeBoneKeys(bone)
+        self.Dirty = False
+
+    def UpdateBone(self, action, bone: str, data_paths):
+        # Re-reads only these F-Curves of a bone, used after this add-on keys or clears the bone
+        changed = False
+        for path in data_paths:
+            path = GetBoneDataPath(bone, path)
+            for i in range(4):
+                changed |= self.SetCurveKeys(bone, (path, i), action.fcurves.find(path, index=i))
+        if changed:
+            self.MergeBoneKeys(bone)
+
+    def SetCurveKeys(self, bone: str, key, fcurve):
+        # Stores the key frames of the F-Curve, or removes them if it is None.  Returns true if they changed
+        if fcurve is None:
+            if self.CurveKeys.pop(key, None) is None:
+                return False
+            self.BoneCurves[bone].discard(key)
+            return True
+
+        frames = ReadCurveFrames(fcurve)
+        if self.CurveKeys.get(key) == frames:
+            return False
+        self.CurveKeys[key] = frames
+        self.BoneCurves.setdefault(bone, set()).add(key)
+        return True
+
+    def MergeBoneKeys(self, bone: str):
+        old = self.BoneKeys.get(bone, ())
+        frames = set()
+        for key in self.BoneCurves.get(bone, ()):
+            frames.update(self.CurveKeys[key])
+        if len(frames) > 0:
+            self.BoneKeys[bone] = array('f', sorted(frames))
+        else:
+            self.BoneKeys.pop(bone, None)
+
+        # Only the frames keyed or un-keyed on this bone can change the caches holding it
+        diff = frames.symmetric_difference(old)
+        for key in self.BoneMerged.get(bone, ()):
+            self.UpdateMergedKeys(key, diff)
+
+    def UpdateMergedKeys(self, key, frames):
+        bones, mode = key
+        keys = self.MergedKeys[key]
+        test = any if mode == 'ANY' else all
+        for f in frames:
+            i = bisect_left(keys, f - KeyFrameTolerance)
+            present = i < len(keys) and keys[i] <= f + KeyFrameTolerance
+            keyed = test(self.HasKey(b, f) for b in bones)
+            if keyed and not present:
+                keys.insert(i, f)
+            elif present and not keyed:
+                del keys[i]
+
+    def GetMergedKeys(self, bones, mode: str = 'ANY'):
+        """
+        Gets the sorted key frames of a group of bones, merged the first time they are asked for.
+        :param bones: Tuple of the bone names.
+        :param mode: 'ANY' for frames where any of the bones are keyed, or 'ALL' for frames where all of them are.
+        :return: Sorted array of key frames.
+        """
+        key = (bones, mode)
+        keys = self.MergedKeys.get(key)
+        if keys is None:
+            frames = [set(self.BoneKeys.get(b, ())) for b in bones]
+            if len(frames) == 0:
+                frames = set()
+            elif mode == 'ANY':
+                frames = set.union(*frames)
+            else:
+                frames = set.intersection(*frames)
+            keys = self.MergedKeys[key] = array('f', sorted(frames))
+            for b in bones:
+                self.BoneMerged.setdefault(b, set()).add(key)
+        return keys
+
+    def HasKey(self, bone: str, frame: float):
+        keys = self.BoneKeys.get(bone)
+        if keys is None:
+            return False
+        i = bisect_left(keys, frame - KeyFrameTolerance)
+        return i < len(keys) and keys[i] <= frame + KeyFrameTolerance
+
+
+KeyFrameTolerance = 0.001  # Frames closer than this are the same frame
+KeyTimeIndices = {}  # Action name -> LeetKeyTimeIndex
+KeyStatusIcons = {'FULL': "KEYFRAME_HLT", 'PARTIAL': "KEYFRAME", 'NONE': "BLANK1"}
+
+
+def GetBoneDataPath(bone: str, path: str):
+    # The data path of a bone property relative to the armature object
+    return 'pose.bones["{}"].{}'.format(bone.replace('"', '\\"'), path)
+
+
+def GetBoneNameFromDataPath(data_path: str):
+    # The bone name of a 'pose.bones["name"]...' data path, or None for other properties
+    if not data_path.startswith('pose.bones["'):
+        return None
+    end = data_path.find('"]', 12)
+    if end == -1:
+        return None
+    return data_path[12:end].replace('\\"', '"')
+
+
+def ReadCurveFrames(fcurve):
+    # Reads every key frame of the F-Curve in a single call
+    keyframe_points = fcurve.keyframe_points
+    co = array('f', bytes(8 * len(keyframe_points)))
+    keyframe_points.foreach_get('co', co)
+    return co[::2]
+
+
+def GetKeyTimeIndex(obj):
+    """
+    Gets the key frame index of an armature's action, building it the first time and updating it after changes.
+    :param obj: The armature object.
+    :return: The LeetKeyTimeIndex of the armature's action, or None if the armature is not animated.
+    """
+    anim_data = obj.animation_data
+    if anim_data is None or anim_data.action is None:
+        return None
+    action = anim_data.action
+
+    index = KeyTimeIndices.get(action.name)
+    if index is None:
+        index = KeyTimeIndices[action.name] = LeetKeyTimeIndex()
+    if index.Dirty:
+        index.Update(action)
+    return index
+
+
+def GetCacheKeyStatus(bone_tools, armatures, cache_name: str, frame: float):
+    """
+    Checks if a cache's bones are keyed on a frame.
+    :param bone_tools: The scene's leet bone tools settings.
+    :param armatures: The armature objects the cache spans.
+    :param cache_name: The name of the cache.
+    :param frame: The frame to check.
+    :return: 'FULL' if every bone is keyed, 'PARTIAL' if some bones are keyed, or 'NONE'.
+    """
+    keyed, total = 0, 0
+    for obj in armatures:
+        store = bone_tools.CachedSelections.get(obj.name)
+        if store is None or cache_name not in store:
+            continue
+        bones = store[cache_name]
+        total += len(bones)
+
+        index = GetKeyTimeIndex(obj)
+        if index is not None:
+            keyed += sum(1 for i in bones if index.HasKey(i, frame))
+
+    if keyed == 0:
+        return 'NONE'
+    return 'FULL' if keyed == total else 'PARTIAL'
+
+
+def GetCacheKeyFrames(bone_tools, armatures, cache_name: str, all_bones: bool = False):
+    """
+    Gets the sorted key frames of a cache's bones.
+    :param bone_tools: The scene's leet bone tools settings.
+    :param armatures: The armature objects the cache spans.
+    :param cache_name: The name of the cache.
+    :param all_bones: If true only the frames where every bone is keyed are returned, otherwise frames where any are.
+    :return: Sorted array of key frames.
+    """
+    mode = 'ALL' if all_bones else 'ANY'
+    arm_keys = []
+    for obj in armatures:
+        store = bone_tools.CachedSelections.get(obj.name)
+        if store is None or cache_name not in store:
+            continue
+        index = GetKeyTimeIndex(obj)
+        if index is None:
+            arm_keys.append(array('f'))
+        else:
+            arm_keys.append(index.GetMergedKeys(tuple(store[cache_name]), mode))
+
+    # A cache on one armature is already merged, caches spanning armatures are merged here
+    if len(arm_keys) == 1:
+        return arm_keys[0]
+    frames = [set(i) for i in arm_keys]
+    if len(frames) == 0:
+        frames = set()
+    elif all_bones:
+        frames = set.intersection(*frames)
+    else:
+        frames = set.union(*frames)
+    return array('f', sorted(frames))
+
+
+def UpdateKeyTimeIndices(bone_tools, pose_bones):
+    # Re-reads just the F-Curves of these bones that this add-on keyed or cleared
+    for b in pose_bones:
+        anim_data = b.id_data.animation_data
+        if anim_data is None or anim_data.action is None:
+            continue
+        index = KeyTimeIndices.get(anim_data.action.name)
+        if index is not None and not index.Dirty:
+            index.UpdateBone(anim_data.action, b.name, GetEffectDataPaths(bone_tools, b, all_rotations=True))
+
+
+@persistent
+def LeetKeyTimeIndexUpdate(scene, depsgraph=None):
+    # Marks the indices of edited actions to be updated the next time they are used
+    if depsgraph is None:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Action):
+            index = KeyTimeIndices.get(update.id.name)
+            if index is not None:
+                index.Dirty = True
+
+
+@persistent
+def LeetKeyTimeIndexClear(*args):
+    # Actions from the last blend file are no longer valid
+    KeyTimeIndices.clear()
+
+
+# ------------------------------------------------------------------------
+#    Project Cache Library Index
+# ------------------------------------------------------------------------
+
+class LeetCacheLibraryIndex:
+    """
+    Index of every cached selection sidecar file under the library folders set in the add-on preferences.
+    The index is saved in blender's config folder, and scanning only re-reads sidecar files whose modified time or
+    size changed.  Loading the saved index and scanning run on a background thread so the UI is never blocked.
+    """
+    __slots__ = ("Files", "Lock", "Loading", "Scanning", "Version", "QueryCache")
+
+    def __init__(self):
+        self.Files = {}  # Sidecar path -> {"mtime", "size", "rigs": armature name -> rig info}
+        self.Lock = threading.Lock()
+        self.Loading = False
+        self.Scanning = False
+        self.Version = 0
+        self.QueryCache = (None, None)  # (query key, results)
+
+    def StartLoad(self, index_path: str):
+        self.Loading = True
+        threading.Thread(target=self.Load, args=(index_path,), daemon=True).start()
+
+    def Load(self, index_path: str):
+        # Runs on the background thread
+        try:
+            self.ReadIndex(index_path)
+        finally:
+            self.Loading = False
+
+    def ReadIndex(self, index_path: str):
+        if not os.path.exists(index_path):
+            return
+        try:
+            with open(index_path, 'r') as openFile:
+                files = json.load(openFile)["files"]
+        except (OSError, ValueError, KeyError):
+            print("Could not read the cache library index:")
+            print(index_path)
+            return
+        for info in files.values():
+            for rig in info["rigs"].values():
+                rig["bones"] = frozenset(rig["bones"])
+        with self.Lock:
+            self.Files = files
+            self.Version += 1
+
+    def Save(self, index_path: str):
+        with self.Lock:
+            files = self.Files
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(index_path, 'w') as saveFile:
+            json.dump({"files": files}, saveFile, default=sorted)
+
+    def StartScan(self, roots, index_path: str):
+        # Returns false if a scan is already running, or the saved index is still loading
+        if self.Scanning or self.Loading:
+            return False
+        self.Scanning = True
+        threading.Thread(target=self.Scan, args=(roots, index_path), daemon=True).start()
+        return True
+
+    def Scan(self, roots, index_path: str):
+        # Runs on the background thread
+        try:
+            with self.Lock:
+                known = self.Files
+
+            # Only new or changed sidecars are read again
+            files, changed = {}, []
+            for path in FindSidecarFiles(roots):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                info = known.get(path)
+                if info is not None and info["mtime"] == st.st_mtime and info["size"] == st.st_size:
+                    files[path] = info
+                else:
+                    changed.append((path, st.st_mtime, st.st_size))
+
+            with ThreadPoolExecutor(max_workers=LibraryScanWorkers) as pool:
+                for path, info in zip((i[0] for i in changed), pool.map(ReadSidecarInfo, changed)):
+                    files[path] = info
+
+            with self.Lock:
+                self.Files = files
+                self.Version += 1
+            self.Save(index_path)
+            print("Leet Bone Tools library scan: {} sidecars, {} read".format(len(files), len(changed)))
+        finally:
+            self.Scanning = False
+
+    def Query(self, fingerprint: str, bone_names, search: str = ""):
+        """
+        Finds the library caches that fit a rig.
+        :param fingerprint: The rig fingerprint from GetRigFingerprint.
+        :param bone_names: Set of the rig's bone names, rigs saved without a fingerprint match if they only use these.
+        :param search: Only caches with this text in their name are returned.
+        :return: List of tuples of the sidecar path, armature name, cache name, and bone count.
+        """
+        key = (self.Version, fingerprint, search)
+        if self.QueryCache[0] == key:
+            return self.QueryCache[1]
+
+        search = search.lower()
+        results = []
+        with self.Lock:
+            files = self.Files
+        for path, info in files.items():
+            for arm, rig in info["rigs"].items():
+                if rig["fingerprint"] != fingerprint and (rig["fingerprint"] is not None or
+                                                          not rig["bones"] <= bone_names):
+                    continue
+                for cache, count in rig["caches"].items():
+                    if search in cache.lower():
+                        results.append((path, arm, cache, count))
+
+        self.QueryCache = (key, results)
+        return results
+
+
+LibraryScanWorkers = 4
+LibraryIndexFileName = "LeetBoneToolsLibraryIndex.json"
+LibraryIndex = None  # LeetCacheLibraryIndex, loaded when first used
+
+
+def GetLibraryIndexPath():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), LibraryIndexFileName)
+
+
+def GetLibraryIndex():
+    global LibraryIndex
+    if LibraryIndex is None:
+        LibraryIndex = LeetCacheLibraryIndex()
+        LibraryIndex.StartLoad(GetLibraryIndexPath())
+        if not bpy.app.timers.is_registered(LeetLibraryScanTimer):
+            bpy.app.timers.register(LeetLibraryScanTimer, first_interval=0.5)
+    return LibraryIndex
+
+
+def IsSidecarFile(file_name: str):
+    return file_name.endswith("-LeetBoneToolsSelections.txt") or \
+           file_name == "LeetBoneToolsSelections_FolderShared.txt"
+
+
+def FindSidecarFiles(roots):
+    # Walks the library folders for the files saved by Leet_CacheBonesSaveDisk
+    for root in roots:
+        for dir_path, dir_names, file_names in os.walk(root):
+            for i in file_names:
+                if IsSidecarFile(i):
+                    yield os.path.join(dir_path, i)
+
+
+def ReadSidecar(file_path: str):
+    # Reads a sidecar without running it as code, returns the caches, cache orders, and rig fingerprints
+    with open(file_path, 'r') as openFile:
+        d = ast.literal_eval(openFile.read())
+    if not isinstance(d, (list, tuple)) or len(d) < 2:
+        raise ValueError("Not a cached selections file")
+
+    caches, order, fingerprints = d[0], d[1], d[2] if len(d) > 2 else {}
+    if not IsNameDict(caches, lambda arm: IsNameDict(arm, IsNameList)) or not IsNameDict(order, IsNameList) or \
+            not IsNameDict(fingerprints, lambda i: isinstance(i, str)):
+        raise ValueError("Badly formed cached selections file")
+    return caches, order, fingerprints
+
+
+def IsNameDict(d, is_value):
+    # Checks a sidecar dict has name keys and valid values
+    return isinstance(d, dict) and all(isinstance(i, str) and is_value(j) for i, j in d.items())
+
+
+def IsNameList(names):
+    return isinstance(names, (list, tuple)) and all(isinstance(i, str) for i in names)
+
+
+def ReadSidecarInfo(file_stat):
+    # Runs on the scan thread pool, gets the library index info for a sidecar
+    path, mtime, size = file_stat
+    try:
+        caches, order, fingerprints = ReadSidecar(path)
+    except Exception:
+        # One bad file must never stop the whole scan
+        print("Could not read cached selections:")
+        print(path)
+        return {"mtime": mtime, "size": size, "rigs": {}}  # Not read again until the file changes
+
+    rigs = {}
+    for arm, arm_caches in caches.items():
+        bones = set()
+        for i in arm_caches.values():
+            bones.update(i)
+        rigs[arm] = {"fingerprint": fingerprints.get(arm),
+                     "bones": frozenset(bones),
+                     "caches": {i: len(arm_caches[i]) for i in order.get(arm, arm_caches.keys()) if i in arm_caches}}
+    return {"mtime": mtime, "size": size, "rigs": rigs}
+
+
+def LeetLibraryScanTimer():
+    # Redraws the panel once the background load or scan is finished
+    if LibraryIndex is not None and (LibraryIndex.Loading or LibraryIndex.Scanning):
+        return 0.5
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    return None
+
+
+# ------------------------------------------------------------------------
+#    Native Keying Set And Bone Collection Sync
+# ------------------------------------------------------------------------
+
+NativeSetPrefix = "LBT "
+NativeKeyingSetEffects = {}  # (scene name, keying set name) -> effects and rotation modes the keying set was built with
+
+
+def GetNativeKeyingSetName(arm_name: str, cache_name: str):
+    return "{}{}: {}".format(NativeSetPrefix, arm_name, cache_name)
+
+
+def GetNativeCollectionName(cache_name: str):
+    return NativeSetPrefix + cache_name
+
+
+def GetEffectsKey(bone_tools, pose_bones):
+    # Keying set paths depend on the effect settings and on each bone's rotation mode
+    return bone_tools.EffectLoc, bone_tools.EffectRot, bone_tools.EffectScale, \
+        tuple((b.name, b.rotation_mode) for b in pose_bones)
+
+
+def GetNativeKeyingSet(scene, name: str):
+    for ks in scene.keying_sets:
+        if ks.bl_label == name:
+            return ks
+    return None
+
+
+def SyncCacheKeyingSet(scene, bone_tools, obj, cache_name: str):
+    """
+    Mirrors a cache into a keying set of the scene, only adding and removing the paths that changed.
+    :param scene: The scene holding the keying set.
+    :param bone_tools: The scene's leet bone tools settings.
+    :param obj: The armature object with the cache.
+    :param cache_name: The name of the cache.
+    :return: The keying set, or None if the armature has no such cache and the keying set was removed.
+    """
+    name = GetNativeKeyingSetName(obj.name, cache_name)
+    ks = GetNativeKeyingSet(scene, name)
+    store = bone_tools.CachedSelections.get(obj.name)
+    if store is None or cache_name not in store:
+        if ks is not None:
+            scene.keying_sets.remove(ks)
+        NativeKeyingSetEffects.pop((scene.name, name), None)
+        return None
+
+    if ks is None:
+        ks = scene.keying_sets.new(idname=name, name=name)
+
+    wanted = {}
+    pose_bones = GetCachedPoseBones(obj, store[cache_name])
+    for b in pose_bones:
+        for path in GetEffectDataPaths(bone_tools, b):
+            wanted[GetBoneDataPath(b.name, path)] = b.name
+    for p in list(ks.paths):
+        if p.id == obj and p.data_path in wanted:
+            del wanted[p.data_path]
+        else:
+            ks.paths.remove(p)
+    for path, bone in wanted.items():
+        ks.paths.add(obj, path, index=-1, group_method='NAMED', group_name=bone)
+
+    NativeKeyingSetEffects[(scene.name, name)] = GetEffectsKey(bone_tools, pose_bones)
+    return ks
+
+
+def SyncCacheBoneCollection(bone_tools, obj, cache_name: str):
+    # Mirrors a cache into a bone collection of the armature, only assigning the bones that changed
+    data = obj.data
+    if not hasattr(data, "collections"):
+        # Bone collections were added in blender 4.0
+        return None
+
+    name = GetNativeCollectionName(cache_name)
+    coll = data.collections.get(name)
+    store = bone_tools.CachedSelections.get(obj.name)
+    if store is None or cache_name not in store:
+        if coll is not None:
+            data.collections.remove(coll)
+        return None
+
+    if coll is None:
+        coll = data.collections.new(name)
+
+    wanted = set(i for i in store[cache_name] if i in data.bones)
+    current = set(b.name for b in coll.bones)
+    for i in wanted - current:
+        coll.assign(data.bones[i])
+    for i in current - wanted:
+        coll.unassign(data.bones[i])
+
+    # A bone is shown when any of its collections is, so hiding the collection hides bones with no other collection
+    # and showing it shows bones whose other collections are all hidden.  Neither always keeps which bones are
+    # shown, so pick the one that changes the fewest bones.
+    only_here = hidden_elsewhere = 0
+    for i in wanted:
+        others = [c for c in data.bones[i].collections if c != coll]
+        if not others:
+            only_here += 1
+        elif not any(c.is_visible for c in others):
+            hidden_elsewhere += 1
+    coll.is_visible = only_here > hidden_elsewhere
+    return coll
+
+
+def SyncNativeOrder(bone_tools, obj):
+    # Moves the armature's cache bone collections to the end of its collections, in cache order
+    data = obj.data
+    if not hasattr(data, "collections"):
+        return
+    for i in bone_tools.CachesOrder.get(obj.name, ()):
+        coll = data.collections.get(GetNativeCollectionName(i))
+        if coll is None:
+            continue
+        last = len(data.collections) - 1
+        if hasattr(coll, "child_number"):
+            coll.child_number = last
+        else:
+            data.collections.move(list(data.collections).index(coll), last)
+
+
+def GetNativeCacheNames(scene, obj):
+    # The caches that have a native keying set or bone collection on this armature
+    names = set()
+    prefix = GetNativeKeyingSetName(obj.name, "")
+    for ks in scene.keying_sets:
+        if ks.bl_label.startswith(prefix):
+            names.add(ks.bl_label[len(prefix):])
+    if hasattr(obj.data, "collections"):
+        for coll in obj.data.collections:
+            if coll.name.startswith(NativeSetPrefix):
+                names.add(coll.name[len(NativeSetPrefix):])
+    return names
+
+
+def SyncNativeSets(context, bone_tools, armatures=None, cache_names=None):
+    """
+    Mirrors caches into native keying sets and bone collections.  The cached selections are the source of truth,
+    native sets are only ever written to, and native sets of deleted caches are removed.
+    :param context: The current blender context.
+    :param bone_tools: The scene's leet bone tools settings.
+    :param armatures: The armature objects to sync, all armatures in the scene with caches if None.
+    :param cache_names: The caches to sync, every cache of each armature if None.
+    """
+    scene = context.scene
+    if armatures is None:
+        armatures = [i for i in scene.objects if i.type == 'ARMATURE' and i.name in bone_tools.CachedSelections]
+
+    for obj in armatures:
+        names = cache_names
+        if names is None:
+            names = set(bone_tools.CachedSelections.get(obj.name, ())) | GetNativeCacheNames(scene, obj)
+        for i in names:
+            SyncCacheKeyingSet(scene, bone_tools, obj, i)
+            SyncCacheBoneCollection(bone_tools, obj, i)
+        SyncNativeOrder(bone_tools, obj)
+
+
+def ClearNativeSets(context):
+    # Removes every native keying set and bone collection made by the sync
+    scene = context.scene
+    for ks in [i for i in scene.keying_sets if i.bl_label.startswith(NativeSetPrefix)]:
+        scene.keying_sets.remove(ks)
+    for obj in scene.objects:
+        if obj.type == 'ARMATURE' and hasattr(obj.data, "collections"):
+            for coll in [i for i in obj.data.collections if i.name.startswith(NativeSetPrefix)]:
+                obj.data.collections.remove(coll)
+    NativeKeyingSetEffects.clear()
+
+
+def KeyCacheNative(context, bone_tools, obj, cache_name: str):
+    # Keys a cache with one call using its keying set, returns false if it has no keying set
+    scene = context.scene
+    name = GetNativeKeyingSetName(obj.name, cache_name)
+    ks = GetNativeKeyingSet(scene, name)
+    store = bone_tools.CachedSelections.get(obj.name)
+    pose_bones = GetCachedPoseBones(obj, store[cache_name]) if store is not None and cache_name in store else []
+    if ks is None or NativeKeyingSetEffects.get((scene.name, name)) != GetEffectsKey(bone_tools, pose_bones):
+        # The keying set is rebuilt after the bone keying tools settings or a bone's rotation mode change
+        ks = SyncCacheKeyingSet(scene, bone_tools, obj, cache_name)
+    if ks is None:
+        return False
+
+    keying_sets = scene.keying_sets
+    active_index = keying_sets.active_index
+    keying_sets.active = ks
+    try:
+        bpy.ops.anim.keyframe_insert()
+    finally:
+        keying_sets.active_index = active_index
+    return True
+
+
+def SelectCacheNative(context, obj, cache_name: str):
+    # Selects a cache with one call using its bone collection, returns false if it can't be used
+    data = obj.data
+    if obj != context.object or not hasattr(data, "collections"):
+        # The native operator only selects bones on the active armature
+        return False
+    coll = data.collections.get(GetNativeCollectionName(cache_name))
+    if coll is None:
+        return False
+
+    active = data.collections.active
+    data.collections.active = coll
+    bpy.ops.armature.collection_select()
+    data.collections.active = active
+    return True
+
+
+# ------------------------------------------------------------------------
+#    Cache Pose Clipboard
+# ------------------------------------------------------------------------
+
+class LeetPoseClipboard:
+    """
+    Transforms of a cache's bones copied over a range of frames.
+    The values are one contiguous array in channel order, holding every copied frame of a channel in a row, so pasting
+    a channel is a single slice.
+    """
+    __slots__ = ("Fingerprint", "SourceName", "CacheName", "FrameStart", "Channels", "FrameCount", "Values")
+
+    def __init__(self, fingerprint: str, source_name: str, cache_name: str, frame_start: int, channels,
+                 frame_count: int, values):
+        self.Fingerprint = fingerprint
+        self.SourceName = source_name  # The armature object the pose was copied from
+        self.CacheName = cache_name
+        self.FrameStart = frame_start
+        self.Channels = channels  # List of (bone name, data path, array index)
+        self.FrameCount = frame_count
+        self.Values = values  # array('f') of len(Channels) * FrameCount values
+
+    def GetChannelValues(self, channel: int, offset: int, length: int, loop: bool):
+        # The values of one channel for the pasted frames, wrapping around the copied frames when looping
+        start = channel * self.FrameCount
+        if not loop:
+            return self.Values[start + offset:start + offset + length]
+        return array('f', (self.Values[start + (offset + i) % self.FrameCount] for i in range(length)))
+
+
+PoseClipboard = None  # LeetPoseClipboard of the last copied cache pose
+MirrorSigns = {
+    'location': (-1.0, 1.0, 1.0),
+    'rotation_euler': (1.0, -1.0, -1.0),
+    'rotation_quaternion': (1.0, 1.0, -1.0, -1.0),
+    'rotation_axis_angle': (1.0, 1.0, -1.0, -1.0),
+    'scale': (1.0, 1.0, 1.0),
+}
+
+
+def CopyCachePose(bone_tools, obj, cache_name: str, frame_start: int, frame_end: int):
+    """
+    Copies the transforms of a cache's bones over a frame range from the armature's F-Curves, without changing frames.
+    :param bone_tools: The scene's leet bone tools settings.
+    :param obj: The armature object with the cache.
+    :param cache_name: The name of the cache.
+    :param frame_start: The first frame to copy.
+    :param frame_end: The last frame to copy.
+    :return: A LeetPoseClipboard.
+    """
+    frames = range(frame_start, frame_end + 1)
+    anim_data = obj.animation_data
+    action = anim_data.action if anim_data is not None else None
+
+    channels = []
+    values = array('f')
+    for b in GetCachedPoseBones(obj, bone_tools.CachedSelections[obj.name][cache_name]):
+        for path in GetEffectDataPaths(bone_tools, b):
+            prop = getattr(b, path)
+            data_path = GetBoneDataPath(b.name, path)
+            for i in range(len(prop)):
+                channels.append((b.name, path, i))
+                fc = action.fcurves.find(data_path, index=i) if action is not None else None
+                if fc is None:
+                    # Not animated, so the current value holds for every frame
+                    values.extend([prop[i]] * len(frames))
+                else:
+                    values.extend(fc.evaluate(f) for f in frames)
+
+    return LeetPoseClipboard(GetRigFingerprint(obj), obj.name, cache_name, frame_start, channels, len(frames), values)
+
+
+def WriteCurveKeys(fcurve, frames, values):
+    # Replaces the keys of the F-Curve over the frames, adding every new key in one batch
+    keyframe_points = fcurve.keyframe_points
+    existing = ReadCurveFrames(fcurve)
+    lo, hi = frames[0] - 0.5, frames[-1] + 0.5
+    for i in reversed(range(len(existing))):
+        if lo <= existing[i] <= hi:
+            keyframe_points.remove(keyframe_points[i], fast=True)
+
+    start = len(keyframe_points)
+    keyframe_points.add(len(frames))
+    co = array('f', bytes(8 * len(keyframe_points)))
+    keyframe_points.foreach_get('co', co)
+    co[2 * start::2] = array('f', frames)
+    co[2 * start + 1::2] = values
+    keyframe_points.foreach_set('co', co)
+    fcurve.update()
+
+
+def PasteCachePose(clipboard, obj, frame_start: int, length: int, offset: int, loop: bool, mirror: bool):
+    """
+    Writes copied transforms to an armature's F-Curves, one batch per F-Curve with no frame changes.
+    :param clipboard: The LeetPoseClipboard to paste.
+    :param obj: The armature object to paste to.
+    :param frame_start: The first frame to paste to.
+    :param length: The number of frames to paste, or 0 for every copied frame after the offset.
+    :param offset: The copied frame to start pasting from.
+    :param loop: If true the copied frames repeat to fill the length.
+    :param mirror: If true the pose is mirrored onto the bones of the opposite side.
+    :return: The number of F-Curves written.
+    """
+    if length <= 0:
+        length = clipboard.FrameCount - offset
+    if not loop:
+        length = min(length, clipboard.FrameCount - offset)
+    if length <= 0:
+        return 0
+    frames = [float(frame_start + i) for i in range(length)]
+
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    if obj.animation_data.action is None:
+        obj.animation_data.action = bpy.data.actions.new(obj.name + "Action")
+    action = obj.animation_data.action
+
+    count = 0
+    pose_bones = obj.pose.bones
+    for c, (bone, path, i) in enumerate(clipboard.Channels):
+        values = clipboard.GetChannelValues(c, offset, length, loop)
+        if mirror:
+            bone = bpy.utils.flip_name(bone)
+            sign = MirrorSigns[path][i]
+            if sign < 0:
+                values = array('f', (-v for v in values))
+        if pose_bones.get(bone) is None:
+            continue
+
+        data_path = GetBoneDataPath(bone, path)
+        fc = action.fcurves.find(data_path, index=i)
+        if fc is None:
+            fc = action.fcurves.new(data_path, index=i, action_group=bone)
+        WriteCurveKeys(fc, frames, values)
+        count += 1
+
+    # The F-Curves were written directly, so the pose is only shown again once the armature is re-evaluated
+    obj.update_tag()
+
+    # The keys were written directly, so the key time index re-reads the action
+    index = KeyTimeIndices.get(action.name)
+    if index is not None:
+        index.Dirty = True
+    return count
+
+
 # ------------------------------------------------------------------------
 #    Operators - Cached Bone Selections / Saving / Loading
 # ------------------------------------------------------------------------
@@ -207,21 +1725,33 @@ class Leet_CacheBonesLoadDisk(Operator):
         # bone_tools.AttemptedLoadBoneCache = True
         cwd, fileName = GetCWDAndFileName(bone_tools.UseDirectorySaves)
         filePath = os.path.join(cwd, fileName)
+        CacheRegistry.SidecarPaths[bpy.data.filepath] = filePath
         print(filePath)
 
         if os.path.exists(filePath):
-            # Create the file
-            openFile = open(filePath, 'r')
-            d = eval(openFile.read())
-            openFile.close()
+            # Read the file
+            try:
+                caches, order = ReadSidecar(filePath)[:2]
+            except (OSError, ValueError, SyntaxError, TypeError, IndexError):
+                print("Could not read cached selections:")
+                print(filePath)
+                self.report({'WARNING'}, "Could not read the cached bone selections file")
+                return {'CANCELLED'}
 
             # Load the cache data
-            for i in d[0].keys():
-                bone_tools.CachedSelections[i] = d[0][i]
+            for i in caches.keys():
+                bone_tools.CachedSelections[i] = LeetRigCacheStore(caches[i])
 
             # Load the list order data
-            for j in d[1].keys():
-                bone_tools.CachesOrder[j] = d[1][j]
+            for j in order.keys():
+                bone_tools.CachesOrder[j] = [sys.intern(k) for k in order[j]]
+
+            # Mirror the loaded caches
+            if bone_tools.SyncNativeSets:
+                SyncNativeSets(context, bone_tools)
+
+            # Stay under the registry memory limit
+            TrimCacheRegistry()
 
         else:
             print("Could not find file to load:")
@@ -243,12 +1773,13 @@ class Leet_CacheBonesSaveDisk(Operator):
         # Saves the current matches to a file so they can be loaded.
         cwd, fileName = GetCWDAndFileName(boneTools.UseDirectorySaves)
         filePath = os.path.join(cwd, fileName)
+        CacheRegistry.SidecarPaths[bpy.data.filepath] = filePath
 
-        # Create the file
-        saveFile = open(filePath, 'w')
-        fileContent = str([boneTools.CachedSelections, boneTools.CachesOrder])
-        saveFile.write(str(fileContent))
-        saveFile.close()
+        # Update the file, armatures of other blend files sharing it are kept
+        caches = dict(boneTools.CachedSelections.items())
+        fingerprints = {i: GetRigFingerprint(bpy.data.objects[i]) for i in caches
+                        if i in bpy.data.objects and bpy.data.objects[i].type == 'ARMATURE'}
+        WriteSidecar(filePath, caches, dict(boneTools.CachesOrder.items()), fingerprints)
 
         return {'FINISHED'}
 
@@ -267,24 +1798,33 @@ class Leet_CacheSelectedBones(Operator):
         bone_tools.CurrArm = bpy.context.object.name
         newGroup = bone_tools.NewCacheName
 
-        # Cache the selected bones
-        if len(bpy.context.selected_pose_bones) > 0:
-
-            # Add new dict item for saved group
-            bone_tools.CachedSelections[bone_tools.CurrArm][newGroup] = []
-            bone_tools.CachesOrder[bone_tools.CurrArm].append(newGroup)
-
-            # Get the set of valid bones
-            bones = set(bpy.data.objects[bone_tools.CurrArm].data.bones.keys())
-
-            for i in bpy.context.selected_pose_bones:
-                # Filter out bones on other armatures
-                if i.name in bones:
-                    bone_tools.CachedSelections[bone_tools.CurrArm][newGroup].append(i.name)
+        # Cache the selected bones, the cache spans every armature with selected bones
+        groups = GroupPoseBonesByArmature(bpy.context.selected_pose_bones)
+        for obj, bones in groups.items():
+            store = GetRigCacheStore(bone_tools, obj.name)
+
+            # Add new order item for saved group
+            if newGroup not in store:
+                bone_tools.CachesOrder[obj.name].append(sys.intern(newGroup))
+            store[newGroup] = [i.name for i in bones]
+
+        # The new cache replaces an old cache of the same name on the armatures without selected bones
+        replaced = []
+        if len(groups) > 0:
+            for obj in GetCacheArmatures(bone_tools, GetPoseArmatures(context), newGroup):
+                if obj not in groups:
+                    del bone_tools.CachedSelections[obj.name][newGroup]
+                    order = bone_tools.CachesOrder[obj.name]
+                    del order[order.index(newGroup)]
+                    replaced.append(obj)
+
+        # Mirror the new cache
+        if bone_tools.SyncNativeSets:
+            SyncNativeSets(context, bone_tools, list(groups.keys()) + replaced, [newGroup])
 
-            # Save changes
-            if bone_tools.AutoSaveBoneCaches:
-                bpy.ops.leet.cached_bones_save_disk()
+        # Save changes
+        if len(groups) > 0 and bone_tools.AutoSaveBoneCaches:
+            bpy.ops.leet.cached_bones_save_disk()
 
         return {'FINISHED'}
 
@@ -302,21 +1842,28 @@ class Leet_SelectCachedBones(Operator):
 
         # Save Arm Name
         bone_tools.CurrArm = bpy.context.object.name
+        armatures = GetCacheArmatures(bone_tools, GetPoseArmatures(context), self.sel_group)
 
         # Check valid input
         if self.sel_group == "":
             return {'FINISHED'}
-        elif self.sel_group not in bone_tools.CachedSelections[bone_tools.CurrArm]:
+        elif len(armatures) == 0:
             return {'FINISHED'}
 
         # Clear old selection?
         if bone_tools.ReplaceSelected:
             bpy.ops.pose.select_all(action='DESELECT')
 
-        # Select the cached bones
-        for i in bone_tools.CachedSelections[bone_tools.CurrArm][self.sel_group]:
-            b = bpy.data.objects[bone_tools.CurrArm].data.bones[i]
-            b.select = True
+        # Select the cached bones of each armature
+        for obj in armatures:
+            if bone_tools.SyncNativeSets and SelectCacheNative(context, obj, self.sel_group):
+                continue
+
+            bones = obj.data.bones
+            for i in bone_tools.CachedSelections[obj.name][self.sel_group]:
+                b = bones.get(i)
+                if b is not None:
+                    b.select = True
 
         # Should we focus on the selected objects?
         if bone_tools.FocusOnSelected:
@@ -340,31 +1887,37 @@ class Leet_CachedBoneMoveIndex(Operator):
         # Save Arm Name
         bone_tools.CurrArm = bpy.context.object.name
 
-        # Get arm cache count
-        c = len(bone_tools.CachesOrder[bone_tools.CurrArm])
-
         if self.sel_group == "":
             return {'FINISHED'}
-        elif self.sel_group not in bone_tools.CachesOrder[bone_tools.CurrArm]:
-            return {'FINISHED'}
-        elif c <= 1:
-            return {'FINISHED'}
 
-        # Switch the index
-        modVal = len(bone_tools.CachesOrder[bone_tools.CurrArm])
-        sel_index = bone_tools.CachesOrder[bone_tools.CurrArm].index(self.sel_group)
-        if self.move_up:
-            new_index = sel_index - 1
-        else:
-            new_index = sel_index + 1
-        sel_index = sel_index % modVal
-        new_index = new_index % modVal
-        bone_tools.CachesOrder[bone_tools.CurrArm][sel_index], \
-        bone_tools.CachesOrder[bone_tools.CurrArm][new_index] = bone_tools.CachesOrder[bone_tools.CurrArm][new_index], \
-                                                                bone_tools.CachesOrder[bone_tools.CurrArm][sel_index]
+        moved = False
+        for obj in GetPoseArmatures(context):
+            order = bone_tools.CachesOrder.get(obj.name)
+
+            # Get arm cache count
+            if order is None or self.sel_group not in order:
+                continue
+            elif len(order) <= 1:
+                continue
+
+            # Switch the index
+            modVal = len(order)
+            sel_index = order.index(self.sel_group)
+            if self.move_up:
+                new_index = sel_index - 1
+            else:
+                new_index = sel_index + 1
+            sel_index = sel_index % modVal
+            new_index = new_index % modVal
+            order[sel_index], order[new_index] = order[new_index], order[sel_index]
+            moved = True
+
+            # Mirror the new order
+            if bone_tools.SyncNativeSets:
+                SyncNativeOrder(bone_tools, obj)
 
         # Save changes
-        if bone_tools.AutoSaveBoneCaches:
+        if moved and bone_tools.AutoSaveBoneCaches:
             bpy.ops.leet.cached_bones_save_disk()
 
         return {'FINISHED'}
@@ -383,16 +1936,22 @@ class Leet_DeleteCachedBonesSet(Operator):
 
         # Save Arm Name
         bone_tools.CurrArm = bpy.context.object.name
+        armatures = GetCacheArmatures(bone_tools, GetPoseArmatures(context), self.sel_group)
 
         if self.sel_group == "":
             return {'FINISHED'}
-        elif self.sel_group not in bone_tools.CachedSelections[bone_tools.CurrArm]:
+        elif len(armatures) == 0:
             return {'FINISHED'}
 
-        # Delete the selection cache
-        del bone_tools.CachedSelections[bone_tools.CurrArm][self.sel_group]
-        ind = bone_tools.CachesOrder[bone_tools.CurrArm].index(self.sel_group)
-        del bone_tools.CachesOrder[bone_tools.CurrArm][ind]
+        # Delete the selection cache from each armature
+        for obj in armatures:
+            del bone_tools.CachedSelections[obj.name][self.sel_group]
+            order = bone_tools.CachesOrder[obj.name]
+            del order[order.index(self.sel_group)]
+
+        # Remove the deleted cache's native sets
+        if bone_tools.SyncNativeSets:
+            SyncNativeSets(context, bone_tools, armatures, [self.sel_group])
 
         # Save changes
         if bone_tools.AutoSaveBoneCaches:
@@ -401,6 +1960,201 @@ class Leet_DeleteCachedBonesSet(Operator):
         return {'FINISHED'}
 
 
+class Leet_CacheNativeResync(Operator):
+    bl_label = "Resync Keying Sets/Bone Collections"
+    bl_idname = "leet.cached_bones_native_resync"
+    bl_description = "This will rebuild the keying sets and bone collections of every cache from the cached " \
+                     "selections, and remove the ones of deleted caches"
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        SyncNativeSets(context, bone_tools)
+
+        return {'FINISHED'}
+
+
+class Leet_CacheMemoryReport(Operator):
+    bl_label = "Cache Memory Report"
+    bl_idname = "leet.cached_bones_memory_report"
+    bl_description = "This will report the memory used by the cached bone selections of each armature, compared to " \
+                     "storing every cache as a list of bone names"
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        total_compact, total_lists = 0, 0
+        for arm, store in bone_tools.CachedSelections.items():
+            compact, lists = store.GetMemoryBytes()
+            compact += sys.getsizeof(bone_tools.CachesOrder.get(arm, []))
+            total_compact += compact
+            total_lists += lists
+            print("{}: {} caches, {} bones, {} bytes ({} bytes as name lists)".format(
+                arm, len(store), store.GetBoneCount(), compact, lists))
+
+        print("{} armatures loaded this session, {} saved and unloaded".format(
+            len(CacheRegistry.Entries), len(CacheRegistry.Evicted)))
+
+        ratio = total_lists / total_compact if total_compact else 0.0
+        self.report({'INFO'}, "Bone caches use {} bytes for {} armatures ({:.1f}x smaller than name lists)".format(
+            total_compact, len(bone_tools.CachedSelections), ratio))
+
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    Operators - Cache Library Import / Export
+# ------------------------------------------------------------------------
+
+class Leet_CacheBonesExport(Operator, ExportHelper):
+    bl_label = "Export Cached Bones"
+    bl_idname = "leet.cached_bones_export"
+    bl_description = "This will export the cached bone selections to a library file with one record per cache, so " \
+                     "they can be shared with other blend files"
+
+    filename_ext = ".jsonl"
+    filter_glob: StringProperty(default="*.jsonl", options={'HIDDEN'})
+
+    export_all: BoolProperty(
+        name="All Armatures",
+        description="Export the caches of every armature instead of only the armatures in pose mode",
+        default=False
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        if self.export_all:
+            arm_names = list(bone_tools.CachedSelections.keys())
+        else:
+            arm_names = [i.name for i in GetPoseArmatures(context)]
+
+        with open(self.filepath, 'w') as saveFile:
+            count = WriteCacheRecords(saveFile, bone_tools, arm_names)
+
+        self.report({'INFO'}, "Exported {} caches".format(count))
+        return {'FINISHED'}
+
+
+class Leet_CacheBonesImport(Operator, ImportHelper):
+    bl_label = "Import Cached Bones"
+    bl_idname = "leet.cached_bones_import"
+    bl_description = "This will merge the caches in a library file into the cached bone selections"
+
+    filename_ext = ".jsonl"
+    filter_glob: StringProperty(default="*.jsonl", options={'HIDDEN'})
+
+    conflict: EnumProperty(
+        name="Existing Caches",
+        description="What to do when an armature already has a cache with the same name",
+        items=(('SKIP', "Skip", "Keep the existing cache"),
+               ('OVERWRITE', "Overwrite", "Replace the existing cache"),
+               ('RENAME', "Rename", "Add the imported cache under a new name")),
+        default='SKIP'
+    )
+
+    to_active: BoolProperty(
+        name="Import To Active Armature",
+        description="Add every cache to the active armature instead of the armature it was exported from",
+        default=False
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        active = context.object.name if context.object is not None else None
+        added, skipped, skipped_names = 0, 0, []
+
+        # Merge record by record
+        with open(self.filepath, 'r') as openFile:
+            for arm, cache, bones in ReadCacheRecords(openFile):
+                if self.to_active and active is not None:
+                    arm = active
+                if MergeCacheRecord(bone_tools, arm, cache, bones, self.conflict) is None:
+                    # Only the first few names are kept for the report, so large libraries stay streamed
+                    skipped += 1
+                    if skipped <= 5:
+                        skipped_names.append("{}: {}".format(arm, cache))
+                    print("Skipped existing cache:")
+                    print("{}: {}".format(arm, cache))
+                else:
+                    added += 1
+
+        # Mirror the imported caches
+        if added > 0 and bone_tools.SyncNativeSets:
+            SyncNativeSets(context, bone_tools)
+
+        # Save changes
+        if added > 0 and bone_tools.AutoSaveBoneCaches:
+            bpy.ops.leet.cached_bones_save_disk()
+
+        if skipped > 0:
+            self.report({'WARNING'}, "Imported {} caches, skipped {} existing caches: {}{}".format(
+                added, skipped, ", ".join(skipped_names), "..." if skipped > 5 else ""))
+        else:
+            self.report({'INFO'}, "Imported {} caches".format(added))
+        return {'FINISHED'}
+
+
+class Leet_CacheLibraryScan(Operator):
+    bl_label = "Scan Cache Library"
+    bl_idname = "leet.cache_library_scan"
+    bl_description = "This will index the saved bone selection caches in the library folders set in the add-on " \
+                     "preferences, in the background.  Only changed files are read again"
+
+    def execute(self, context):
+        prefs = GetAddonPreferences()
+        roots = [i.strip() for i in prefs.LibraryRoots.split(";") if i.strip() != ""] if prefs is not None else []
+        roots = [bpy.path.abspath(i) for i in roots]
+
+        if len(roots) == 0:
+            self.report({'WARNING'}, "Set the cache library folders in the add-on preferences")
+            return {'CANCELLED'}
+
+        if GetLibraryIndex().StartScan(roots, GetLibraryIndexPath()) and \
+                not bpy.app.timers.is_registered(LeetLibraryScanTimer):
+            bpy.app.timers.register(LeetLibraryScanTimer, first_interval=0.5)
+        return {'FINISHED'}
+
+
+class Leet_CacheLibraryImport(Operator):
+    bl_label = "Import Library Cache"
+    bl_idname = "leet.cache_library_import"
+    bl_description = "This will add this library cache to the active armature"
+
+    filepath: StringProperty()
+    armature: StringProperty()
+    sel_group: StringProperty()
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        try:
+            caches = ReadSidecar(self.filepath)[0]
+            bones = caches[self.armature][self.sel_group]
+        except (OSError, ValueError, SyntaxError, TypeError, IndexError, KeyError):
+            self.report({'WARNING'}, "Could not read {} from {}".format(self.sel_group, self.filepath))
+            return {'CANCELLED'}
+
+        name = MergeCacheRecord(bone_tools, context.object.name, self.sel_group, bones, 'RENAME')
+
+        # Mirror the imported cache
+        if bone_tools.SyncNativeSets:
+            SyncNativeSets(context, bone_tools, [context.object], [name])
+
+        # Save changes
+        if bone_tools.AutoSaveBoneCaches:
+            bpy.ops.leet.cached_bones_save_disk()
+
+        self.report({'INFO'}, "Imported {}".format(name))
+        return {'FINISHED'}
+
+
 # ------------------------------------------------------------------------
 #    Operators - Selected Bones Keying and Resetting
 # ------------------------------------------------------------------------
@@ -458,28 +2212,274 @@ class Leet_ClearKeyBones(Operator):
     bl_idname = "leet.clear_key_bones"
     bl_description = "This will delete the translation, rotation, and scale keyframes just for this frame on the " \
                      "selected bones in pose mode as set in the bone keying tools settings"
+    bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
         scene = context.scene
 
-        # Set keyfranes on the selected bones
+        # Delete keyfranes on the selected bones of each armature
         bone_tools = scene.leetBoneToolsSettings
         f = bpy.context.scene.frame_current
 
-        for i in bpy.context.selected_pose_bones:
-            if bone_tools.EffectLoc:
-                i.keyframe_delete('location', frame=f)
+        for bones in GroupPoseBonesByArmature(bpy.context.selected_pose_bones).values():
+            ClearKeyPoseBones(bone_tools, bones, f)
+
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    Operators - Cached Bones Keying and Resetting ( No Selection Changes )
+# ------------------------------------------------------------------------
+
+class Leet_KeyCachedBones(Operator):
+    bl_label = "Key Cached Bones"
+    bl_idname = "leet.cached_bones_key"
+    bl_description = "This will key this cached selection's bones as set in the bone keying tools settings, without " \
+                     "changing the selected bones"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    sel_group: bpy.props.StringProperty()
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        # Save Arm Name
+        bone_tools.CurrArm = bpy.context.object.name
+
+        # Check valid input
+        if self.sel_group == "":
+            return {'FINISHED'}
+
+        for obj in GetCacheArmatures(bone_tools, GetPoseArmatures(context), self.sel_group):
+            bones = GetCachedPoseBones(obj, bone_tools.CachedSelections[obj.name][self.sel_group])
+            if bone_tools.SyncNativeSets and KeyCacheNative(context, bone_tools, obj, self.sel_group):
+                UpdateKeyTimeIndices(bone_tools, bones)
+            else:
+                KeyPoseBones(bone_tools, bones, scene.frame_current)
+
+        return {'FINISHED'}
+
+
+class Leet_ClearKeyCachedBones(Operator):
+    bl_label = "Clear Cached Bones Keys"
+    bl_idname = "leet.cached_bones_clear_key"
+    bl_description = "This will delete this cached selection's keyframes just for this frame as set in the bone " \
+                     "keying tools settings, without changing the selected bones"
+    bl_options = {'REGISTER', 'UNDO'}
 
-            if bone_tools.EffectRot:
-                i.keyframe_delete('rotation_euler', frame=f)
-                i.keyframe_delete('rotation_quaternion', frame=f)
+    sel_group: bpy.props.StringProperty()
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        # Save Arm Name
+        bone_tools.CurrArm = bpy.context.object.name
+
+        # Check valid input
+        if self.sel_group == "":
+            return {'FINISHED'}
+
+        for obj in GetCacheArmatures(bone_tools, GetPoseArmatures(context), self.sel_group):
+            bones = GetCachedPoseBones(obj, bone_tools.CachedSelections[obj.name][self.sel_group])
+            ClearKeyPoseBones(bone_tools, bones, scene.frame_current)
+
+        return {'FINISHED'}
+
+
+class Leet_ResetCachedBones(Operator):
+    bl_label = "Reset Cached Bones"
+    bl_idname = "leet.cached_bones_reset"
+    bl_description = "This will reset this cached selection's bones as set in the bone keying tools settings, " \
+                     "without changing the selected bones"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    sel_group: bpy.props.StringProperty()
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        # Save Arm Name
+        bone_tools.CurrArm = bpy.context.object.name
+
+        # Check valid input
+        if self.sel_group == "":
+            return {'FINISHED'}
 
-            if bone_tools.EffectScale:
-                i.keyframe_delete('scale', frame=f)
+        for obj in GetCacheArmatures(bone_tools, GetPoseArmatures(context), self.sel_group):
+            bones = GetCachedPoseBones(obj, bone_tools.CachedSelections[obj.name][self.sel_group])
+            ResetPoseBones(bone_tools, bones)
 
         return {'FINISHED'}
 
 
+class Leet_CachedBonesJumpKey(Operator):
+    bl_label = "Jump To Cached Bones Key"
+    bl_idname = "leet.cached_bones_jump_key"
+    bl_description = "This will jump to the previous or next frame where this cached selection's bones are keyed"
+
+    sel_group: bpy.props.StringProperty()
+    next: bpy.props.BoolProperty(default=True)
+    all_bones: bpy.props.BoolProperty(default=False)
+
+    def execute(self, context):
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        # Check valid input
+        if self.sel_group == "":
+            return {'CANCELLED'}
+
+        frames = GetCacheKeyFrames(bone_tools, GetPoseArmatures(context), self.sel_group, self.all_bones)
+
+        # Keys within half a frame round to the current frame
+        f = scene.frame_current
+        if self.next:
+            i = bisect_right(frames, f + 0.5)
+        else:
+            i = bisect_left(frames, f - 0.5) - 1
+
+        if i < 0 or i >= len(frames):
+            self.report({'INFO'}, "No more keyframes for {}".format(self.sel_group))
+            return {'CANCELLED'}
+
+        scene.frame_current = int(round(frames[i]))
+        return {'FINISHED'}
+
+
+def DrawCacheKeyingButtons(layout, bone_tools, cache_name):
+    # Icon only jump, key, clear, reset, and copy pose buttons for a cache
+    op = layout.operator("leet.cached_bones_jump_key", text="", icon="PREV_KEYFRAME")
+    op.sel_group, op.next, op.all_bones = cache_name, False, bone_tools.JumpKeyAllBones
+    op = layout.operator("leet.cached_bones_jump_key", text="", icon="NEXT_KEYFRAME")
+    op.sel_group, op.next, op.all_bones = cache_name, True, bone_tools.JumpKeyAllBones
+    op = layout.operator("leet.cached_bones_key", text="", icon="KEYTYPE_KEYFRAME_VEC")
+    op.sel_group = cache_name
+    op = layout.operator("leet.cached_bones_clear_key", text="", icon="TRASH")
+    op.sel_group = cache_name
+    op = layout.operator("leet.cached_bones_reset", text="", icon="FILE_REFRESH")
+    op.sel_group = cache_name
+    op = layout.operator("leet.cached_bones_copy_pose", text="", icon="COPYDOWN")
+    op.sel_group = cache_name
+
+
+# ------------------------------------------------------------------------
+#    Operators - Cached Bones Pose Clipboard
+# ------------------------------------------------------------------------
+
+class Leet_CachedBonesCopyPose(Operator):
+    bl_label = "Copy Cached Bones Pose"
+    bl_idname = "leet.cached_bones_copy_pose"
+    bl_description = "This will copy the transforms of this cached selection's bones over a range of frames, as set " \
+                     "in the bone keying tools settings"
+
+    sel_group: bpy.props.StringProperty()
+    frame_start: IntProperty(name="Start Frame")
+    frame_end: IntProperty(name="End Frame")
+
+    def invoke(self, context, event):
+        # Default to the preview or scene frame range
+        scene = context.scene
+        if scene.use_preview_range:
+            self.frame_start, self.frame_end = scene.frame_preview_start, scene.frame_preview_end
+        else:
+            self.frame_start, self.frame_end = scene.frame_start, scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        global PoseClipboard
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+
+        # Check valid input
+        armatures = GetCacheArmatures(bone_tools, GetPoseArmatures(context), self.sel_group)
+        if self.sel_group == "":
+            return {'CANCELLED'}
+        elif len(armatures) == 0:
+            return {'CANCELLED'}
+        elif self.frame_end < self.frame_start:
+            self.report({'WARNING'}, "The end frame is before the start frame")
+            return {'CANCELLED'}
+
+        # Copy from the active armature if it has the cache
+        PoseClipboard = CopyCachePose(bone_tools, armatures[0], self.sel_group, self.frame_start, self.frame_end)
+        self.report({'INFO'}, "Copied {} frames of {}".format(PoseClipboard.FrameCount, self.sel_group))
+
+        return {'FINISHED'}
+
+
+class Leet_CachedBonesPastePose(Operator):
+    bl_label = "Paste Cached Bones Pose"
+    bl_idname = "leet.cached_bones_paste_pose"
+    bl_description = "This will key the copied cached bones pose over a range of frames, on every armature in pose " \
+                     "mode with the same bones as the copied armature.  The copied armature is only pasted to if the " \
+                     "frames or sides differ, or if asked to"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frame_start: IntProperty(name="Start Frame")
+    length: IntProperty(
+        name="Frames",
+        description="The number of frames to paste, 0 pastes every copied frame",
+        default=0,
+        min=0
+    )
+    offset: IntProperty(
+        name="Offset",
+        description="The copied frame to start pasting from",
+        default=0,
+        min=0
+    )
+    loop: BoolProperty(
+        name="Loop",
+        description="Repeat the copied frames to fill the pasted frames",
+        default=False
+    )
+    mirror: BoolProperty(
+        name="Mirror",
+        description="Paste the pose onto the bones of the opposite side, mirrored",
+        default=False
+    )
+    to_source: BoolProperty(
+        name="Paste To Copied Armature",
+        description="Also paste onto the armature the pose was copied from, even over the frames it was copied from",
+        default=False
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return PoseClipboard is not None
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_current
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        # Pasting the copied frames back onto the same sides of the copied armature would only overwrite them
+        same_keys = self.frame_start == PoseClipboard.FrameStart + self.offset and not self.mirror
+        armatures = [i for i in GetPoseArmatures(context) if GetRigFingerprint(i) == PoseClipboard.Fingerprint and
+                     (i.name != PoseClipboard.SourceName or self.to_source or not same_keys)]
+        if len(armatures) == 0:
+            self.report({'WARNING'}, "No other armature in pose mode has the bones of the copied pose")
+            return {'CANCELLED'}
+        elif self.offset >= PoseClipboard.FrameCount:
+            self.report({'WARNING'}, "Only {} frames were copied".format(PoseClipboard.FrameCount))
+            return {'CANCELLED'}
+
+        for obj in armatures:
+            PasteCachePose(PoseClipboard, obj, self.frame_start, self.length, self.offset, self.loop, self.mirror)
+
+        return {'FINISHED'}
+
+
+def DrawPastePoseButton(layout):
+    # Paste button for the copied cache pose
+    if PoseClipboard is not None:
+        layout.operator("leet.cached_bones_paste_pose", icon="PASTEDOWN",
+                        text="Paste {} Pose ({} Frames)".format(PoseClipboard.CacheName, PoseClipboard.FrameCount))
+
+
 # ------------------------------------------------------------------------
 #    3D View Tool Panel
 # ------------------------------------------------------------------------
@@ -508,17 +2508,15 @@ class OBJECT_PT_LeetBonePanel(Panel):
         #    Move bone and Keying Opps
         # ------------------------------------------------------------------------
 
-        # Set curr arm, and add it to the selection cache dict
-        currArm = bpy.context.object.name
-        if currArm not in bone_tools.CachedSelections:
-            bone_tools.CachedSelections[currArm] = {}
-        if currArm not in bone_tools.CachesOrder:
-            bone_tools.CachesOrder[currArm] = []
+        # The caches of every armature in pose mode
+        armatures = GetPoseArmatures(context)
+        armsName = ", ".join(i.name for i in armatures)
+        caches = GetArmaturesCaches(bone_tools, armatures)
 
         # Number of bones selected
         num_bones_selected = len(bpy.context.selected_pose_bones)
         bones_selected = num_bones_selected > 0
-        caches_count = len(bone_tools.CachedSelections[currArm])
+        caches_count = len(caches)
         bones_cached = caches_count > 0
 
         # ------------------------------------------------------------------------
@@ -555,7 +2553,7 @@ class OBJECT_PT_LeetBonePanel(Panel):
         # Cached Selection Label
         if not bones_cached:
             no_caches_box = layout.box()
-            no_caches_box.label(text="No selections cached for {}".format(currArm))
+            no_caches_box.label(text="No selections cached for {}".format(armsName))
             no_caches_box.operator("leet.cached_bones_load_disk", icon="FILE_FOLDER")
 
         if bones_cached:
@@ -565,8 +2563,8 @@ class OBJECT_PT_LeetBonePanel(Panel):
             selection_box = bone_sel_box.box()
             br = selection_box.row()
 
-            # List all of the bone groups for this arm with the targeted action
-            for i in bone_tools.CachesOrder[currArm]:
+            # List all of the bone groups for these arms with the targeted action
+            for i, size in caches:
 
                 # Make or continue cache row
                 if n == bone_tools.NumCachePerRow:
@@ -575,7 +2573,6 @@ class OBJECT_PT_LeetBonePanel(Panel):
                 n += 1
 
                 # Naming of group
-                size = len(bone_tools.CachedSelections[currArm][i])
                 b = "Bones" if size > 1 else "Bone"
 
                 if bone_tools.EditCaches:  # Delete Group
@@ -600,13 +2597,21 @@ class OBJECT_PT_LeetBonePanel(Panel):
 
                 else:  # Select Group
                     ico = "SELECT_SET" if bone_tools.ReplaceSelected else "SELECT_EXTEND"
-                    op = br.operator("leet.cached_bones_sel", text="{} ({} {})".format(i, size, b), icon=ico)
+                    cache_row = br.row(align=True)
+                    if bone_tools.ViewCacheKeyStatus:
+                        status = GetCacheKeyStatus(bone_tools, armatures, i, scene.frame_current)
+                        cache_row.label(text="", icon=KeyStatusIcons[status])
+                    op = cache_row.operator("leet.cached_bones_sel", text="{} ({} {})".format(i, size, b), icon=ico)
                     op.sel_group = i
 
+                    if bone_tools.ViewCacheKeying:
+                        DrawCacheKeyingButtons(cache_row, bone_tools, i)
+
             # Button Actions Configuration
             sel_action_edit_row = bone_sel_box.row()
             sel_action_edit_row.prop(bone_tools, "ReplaceSelected", icon="SELECT_SET")
             sel_action_edit_row.prop(bone_tools, "FocusOnSelected", icon="ZOOM_SELECTED")
+            DrawPastePoseButton(bone_sel_box)
 
         # Keying Selected Bones Controls Current Frame Tools
         bo = "Bone" if num_bones_selected == 1 else "Bones"
@@ -614,7 +2619,7 @@ class OBJECT_PT_LeetBonePanel(Panel):
         top_row = top_box.row()
         arm_subrow = top_row.row()
         arm_subrow.label(text="{} {} Selected".format(num_bones_selected, bo))
-        arm_subrow.label(text="{}".format(currArm))
+        arm_subrow.label(text="{}".format(armsName))
 
         # Load or Delete Cached Selection
         top_edit_row = top_box.row()
@@ -658,6 +2663,60 @@ class OBJECT_PT_LeetBonePanel(Panel):
                 snap_row.operator("view3d.snap_selected_to_cursor")
 
 
+class OBJECT_PT_LeetBoneLibraryPanel(Panel):
+    bl_label = "Cache Library"
+    bl_idname = "OBJECT_PT_LeetBoneLibraryPanel"
+    bl_parent_id = "OBJECT_PT_LeetBonePanel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Item"
+    bl_context = "posemode"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    MaxResults = 30
+
+    @classmethod
+    def poll(self, context):
+        # Only show panel when an armature is selected.
+        if context.object is not None:
+            return context.object.type == 'ARMATURE'
+        return False
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        bone_tools = scene.leetBoneToolsSettings
+        library = GetLibraryIndex()
+
+        scan_row = layout.row()
+        if library.Loading:
+            scan_row.label(text="Loading library index...", icon="TIME")
+            return
+        elif library.Scanning:
+            scan_row.label(text="Scanning library...", icon="TIME")
+        else:
+            scan_row.operator("leet.cache_library_scan", icon="FILE_REFRESH")
+        layout.prop(bone_tools, "LibrarySearch", icon="VIEWZOOM")
+
+        # Library caches that fit the active rig
+        obj = context.object
+        fingerprint, bone_names = GetRigInfo(obj)
+        results = library.Query(fingerprint, bone_names, bone_tools.LibrarySearch)
+        if len(results) == 0:
+            layout.label(text="No library caches found for {}".format(obj.name))
+            return
+
+        results_box = layout.box()
+        for path, arm, cache, count in results[:self.MaxResults]:
+            row = results_box.row()
+            row.label(text="{} ({}) - {}, {}".format(cache, count, arm, ntSplit(path)[1]))
+            op = row.operator("leet.cache_library_import", text="", icon="IMPORT")
+            op.filepath, op.armature, op.sel_group = path, arm, cache
+
+        if len(results) > self.MaxResults:
+            layout.label(text="{} more, refine the search".format(len(results) - self.MaxResults))
+
+
 # ------------------------------------------------------------------------
 #    3D View Pie Menu - Press ctrl in pose mode to view.
 # ------------------------------------------------------------------------
@@ -696,12 +2755,22 @@ class VIEW3D_MT_LeetMenuShowTools(Menu):
         # Tools
         layout.label(text="Show Tools")
         layout.prop(bone_tools, "ViewFrameKeying")
+        layout.prop(bone_tools, "ViewCacheKeying")
+        if bone_tools.ViewCacheKeying:
+            layout.prop(bone_tools, "JumpKeyAllBones")
+        layout.prop(bone_tools, "ViewCacheKeyStatus")
         layout.prop(bone_tools, "ViewCursorSnapTools")
 
         # Save Options
         layout.label(text="Save/Load Selection Options")
         layout.prop(bone_tools, "UseDirectorySaves")
         layout.prop(bone_tools, "AutoSaveBoneCaches")
+        layout.prop(bone_tools, "SyncNativeSets")
+        if bone_tools.SyncNativeSets:
+            layout.operator("leet.cached_bones_native_resync", icon="FILE_REFRESH")
+        layout.operator("leet.cached_bones_import", icon="IMPORT")
+        layout.operator("leet.cached_bones_export", icon="EXPORT")
+        layout.operator("leet.cached_bones_memory_report", icon="MEMORY")
 
 
 class VIEW3D_MT_LeetMenuShowToolsPie(Menu):
@@ -721,6 +2790,10 @@ class VIEW3D_MT_LeetMenuShowToolsPie(Menu):
         if bone_tools.ViewPieTools:
             layout.label(text="Show Tools")
             layout.prop(bone_tools, "ViewFrameKeying")
+            layout.prop(bone_tools, "ViewCacheKeying")
+            if bone_tools.ViewCacheKeying:
+                layout.prop(bone_tools, "JumpKeyAllBones")
+            layout.prop(bone_tools, "ViewCacheKeyStatus")
             layout.prop(bone_tools, "ViewCursorSnapTools")
 
         # Save Options
@@ -744,12 +2817,15 @@ class VIEW3D_MT_PIE_LeetBonePie(Menu):
         layout = self.layout
         scene = context.scene
         bone_tools = scene.leetBoneToolsSettings
-        curr_arm = bpy.context.object.name
 
-        # curr_arm = bpy.context.object.name
+        # The caches of every armature in pose mode
+        armatures = GetPoseArmatures(context)
+        arms_name = ", ".join(i.name for i in armatures)
+        caches = GetArmaturesCaches(bone_tools, armatures)
+
         num_bones_selected = len(bpy.context.selected_pose_bones)
         bones_selected = num_bones_selected > 0
-        bones_cached = len(bone_tools.CachedSelections[curr_arm]) > 0
+        bones_cached = len(caches) > 0
 
         pie = layout.menu_pie()
 
@@ -767,6 +2843,7 @@ class VIEW3D_MT_PIE_LeetBonePie(Menu):
                 caches_stack = pie.column()
                 cache_view = caches_stack.box()
                 cache_view.label(text="Replace Selection" if bone_tools.ReplaceSelected else "Add To Selection")
+                DrawPastePoseButton(cache_view)
 
             n = 0
             if bone_tools.ViewPieTools:
@@ -774,8 +2851,8 @@ class VIEW3D_MT_PIE_LeetBonePie(Menu):
             else:
                 br = pie.column().box()
 
-            # List all of the bone groups for this arm with the targeted action
-            for i in bone_tools.CachesOrder[curr_arm]:
+            # List all of the bone groups for these arms with the targeted action
+            for i, size in caches:
                 # Make or continue cache row
                 if n == bone_tools.NumCachePerRowPie:
                     n = 0
@@ -786,19 +2863,25 @@ class VIEW3D_MT_PIE_LeetBonePie(Menu):
                 n += 1
 
                 # Generate naming and icon of the bone group
-                size = len(bone_tools.CachedSelections[curr_arm][i])
                 b = "Bones" if size > 1 else "Bone"
                 ico = "SELECT_SET" if bone_tools.ReplaceSelected else "SELECT_EXTEND"
 
                 # Generate the select button
-                op = br.operator("leet.cached_bones_sel", text="{} ({} {})".format(i, size, b),
-                                 icon=ico)
+                cache_row = br.row(align=True)
+                if bone_tools.ViewCacheKeyStatus:
+                    status = GetCacheKeyStatus(bone_tools, armatures, i, scene.frame_current)
+                    cache_row.label(text="", icon=KeyStatusIcons[status])
+                op = cache_row.operator("leet.cached_bones_sel", text="{} ({} {})".format(i, size, b),
+                                        icon=ico)
                 op.sel_group = i
 
+                if bone_tools.ViewCacheKeying:
+                    DrawCacheKeyingButtons(cache_row, bone_tools, i)
+
         else:
             # Option to load the bones
             load = pie.column().box()
-            load.label(text="No selection cached for {}".format(curr_arm))
+            load.label(text="No selection cached for {}".format(arms_name))
             load.operator("leet.cached_bones_load_disk", icon="FILE_FOLDER")
 
         # Show Hide Other Bone Tools Setting
@@ -838,7 +2921,9 @@ class VIEW3D_MT_PIE_LeetBonePie(Menu):
 
 classes = (
     LeetBoneToolsSettings,
+    LeetBoneToolsPreferences,
     OBJECT_PT_LeetBonePanel,
+    OBJECT_PT_LeetBoneLibraryPanel,
     VIEW3D_MT_LeetBoneOppsEffectMenu,
     VIEW3D_MT_PIE_LeetBonePie,
     VIEW3D_MT_LeetMenuShowToolsPie,
@@ -849,9 +2934,21 @@ classes = (
     Leet_CachedBoneMoveIndex,
     Leet_SelectCachedBones,
     Leet_DeleteCachedBonesSet,
+    Leet_CacheNativeResync,
+    Leet_CacheMemoryReport,
+    Leet_CacheBonesExport,
+    Leet_CacheBonesImport,
+    Leet_CacheLibraryScan,
+    Leet_CacheLibraryImport,
     Leet_ResetBones,
     Leet_KeyBones,
     Leet_ClearKeyBones,
+    Leet_KeyCachedBones,
+    Leet_ClearKeyCachedBones,
+    Leet_ResetCachedBones,
+    Leet_CachedBonesJumpKey,
+    Leet_CachedBonesCopyPose,
+    Leet_CachedBonesPastePose,
 )
 
 addon_keymaps = []
@@ -866,6 +2963,15 @@ def register():
     # Register Bone Tools Settings
     bpy.types.Scene.leetBoneToolsSettings = PointerProperty(type=LeetBoneToolsSettings)
 
+    # Keep the keyframe time indices and rig info up to date
+    bpy.app.handlers.depsgraph_update_post.append(LeetKeyTimeIndexUpdate)
+    bpy.app.handlers.depsgraph_update_post.append(LeetRigInfoUpdate)
+    bpy.app.handlers.load_post.append(LeetRigInfoClear)
+    bpy.app.handlers.load_post.append(LeetKeyTimeIndexClear)
+    bpy.app.handlers.load_post.append(LeetCacheRegistryTrim)
+    bpy.app.handlers.save_pre.append(LeetCacheRegistrySavePre)
+    bpy.app.handlers.save_post.append(LeetCacheRegistrySavePost)
+
     # Handle the key mapping
     wm = bpy.context.window_manager
     km = wm.keyconfigs.addon.keymaps.new(name='Pose')
@@ -882,6 +2988,20 @@ def unregister():
     # Delete the scene settings
     del bpy.types.Scene.leetBoneToolsSettings
 
+    # Stop polling a running library scan
+    if bpy.app.timers.is_registered(LeetLibraryScanTimer):
+        bpy.app.timers.unregister(LeetLibraryScanTimer)
+
+    # Remove the keyframe time index and rig info handlers
+    bpy.app.handlers.depsgraph_update_post.remove(LeetKeyTimeIndexUpdate)
+    bpy.app.handlers.depsgraph_update_post.remove(LeetRigInfoUpdate)
+    bpy.app.handlers.load_post.remove(LeetRigInfoClear)
+    bpy.app.handlers.load_post.remove(LeetKeyTimeIndexClear)
+    bpy.app.handlers.load_post.remove(LeetCacheRegistryTrim)
+    bpy.app.handlers.save_pre.remove(LeetCacheRegistrySavePre)
+    bpy.app.handlers.save_post.remove(LeetCacheRegistrySavePost)
+    KeyTimeIndices.clear()
+
     # Handle the key mapping
     wm = bpy.context.window_manager
     for km in addon_keymaps:
@@ -0,0 +1,188 @@
+"""
+Round trip checks of the native keying set and bone collection sync, the cached selections must stay the source of truth.
+Runs headless inside blender 4.0 or newer:
+    blender -b --factory-startup --python-exit-code 1 --python tests/test_native_sync.py
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+try:
+    import bpy
+except ImportError:
+    raise unittest.SkipTest("Needs to run inside blender")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import LeetBoneTools as lbt  # noqa: E402
+
+BoneNames = ("Root", "Spine", "Arm.L", "Arm.R", "Leg.L", "Leg.R")
+
+
+def setUpModule():
+    # Only the settings are needed, the full add-on registers a keymap which has no key config in background mode
+    bpy.utils.register_class(lbt.LeetBoneToolsSettings)
+    bpy.types.Scene.leetBoneToolsSettings = bpy.props.PointerProperty(type=lbt.LeetBoneToolsSettings)
+
+
+def tearDownModule():
+    del bpy.types.Scene.leetBoneToolsSettings
+    bpy.utils.unregister_class(lbt.LeetBoneToolsSettings)
+
+
+def MakeArmature(name: str):
+    arm = bpy.data.armatures.new(name)
+    obj = bpy.data.objects.new(name, arm)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    for i, bone_name in enumerate(BoneNames):
+        eb = arm.edit_bones.new(bone_name)
+        eb.head = (i, 0, 0)
+        eb.tail = (i, 0, 1)
+    bpy.ops.object.mode_set(mode='POSE')
+    return obj
+
+
+def IsBoneShown(bone):
+    # A bone is shown when it has no collections or any of its collections is visible
+    return len(bone.collections) == 0 or any(c.is_visible for c in bone.collections)
+
+
+class TestNativeSync(unittest.TestCase):
+    def setUp(self):
+        self.context = bpy.context
+        self.scene = self.context.scene
+        self.bone_tools = self.scene.leetBoneToolsSettings
+        self.obj = MakeArmature("Rig")
+
+        store = lbt.GetRigCacheStore(self.bone_tools, self.obj.name)
+        store["Arms"] = ["Arm.L", "Arm.R"]
+        store["Legs"] = ["Leg.L", "Leg.R", "Missing"]
+        self.bone_tools.CachesOrder[self.obj.name] = ["Arms", "Legs"]
+
+    def tearDown(self):
+        lbt.ClearNativeSets(self.context)
+        del self.bone_tools.CachedSelections[self.obj.name]
+        bpy.ops.object.mode_set(mode='OBJECT')
+        arm = self.obj.data
+        bpy.data.objects.remove(self.obj)
+        bpy.data.armatures.remove(arm)
+
+    def GetStoreSnapshot(self):
+        store = self.bone_tools.CachedSelections[self.obj.name]
+        return store.ToDict(), list(self.bone_tools.CachesOrder[self.obj.name])
+
+    def assertNativeMatchesStore(self):
+        # Every cache has a keying set and bone collection with exactly its bones, and nothing else is left behind
+        store = self.bone_tools.CachedSelections[self.obj.name]
+        data = self.obj.data
+        self.assertEqual(lbt.GetNativeCacheNames(self.scene, self.obj), set(store.keys()))
+        for cache_name, bone_names in store.items():
+            pose_bones = lbt.GetCachedPoseBones(self.obj, bone_names)
+            wanted = set(lbt.GetBoneDataPath(b.name, i) for b in pose_bones
+                         for i in lbt.GetEffectDataPaths(self.bone_tools, b))
+            ks = lbt.GetNativeKeyingSet(self.scene, lbt.GetNativeKeyingSetName(self.obj.name, cache_name))
+            self.assertIsNotNone(ks)
+            self.assertEqual(set(p.data_path for p in ks.paths), wanted)
+            self.assertTrue(all(p.id == self.obj for p in ks.paths))
+
+            coll = data.collections.get(lbt.GetNativeCollectionName(cache_name))
+            self.assertIsNotNone(coll)
+            self.assertEqual(set(b.name for b in coll.bones), set(b.name for b in pose_bones))
+
+    def test_sync_mirrors_store(self):
+        before = self.GetStoreSnapshot()
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        self.assertNativeMatchesStore()
+        self.assertEqual(self.GetStoreSnapshot(), before)
+
+    def test_resync_follows_store_edits(self):
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        store = self.bone_tools.CachedSelections[self.obj.name]
+        store["Arms"] = ["Arm.L", "Spine"]
+        del store["Legs"]
+        self.bone_tools.CachesOrder[self.obj.name].remove("Legs")
+        store["Core"] = ["Root", "Spine"]
+        self.bone_tools.CachesOrder[self.obj.name].append("Core")
+
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        self.assertNativeMatchesStore()
+
+    def test_native_edits_are_overwritten(self):
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        before = self.GetStoreSnapshot()
+        data = self.obj.data
+        ks = lbt.GetNativeKeyingSet(self.scene, lbt.GetNativeKeyingSetName(self.obj.name, "Arms"))
+        ks.paths.add(self.obj, lbt.GetBoneDataPath("Root", "location"), index=-1)
+        data.collections[lbt.GetNativeCollectionName("Arms")].assign(data.bones["Root"])
+        data.collections.new(lbt.GetNativeCollectionName("Stale"))
+
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        self.assertNativeMatchesStore()
+        self.assertEqual(self.GetStoreSnapshot(), before)
+
+    def test_rotation_mode_change_rebuilds_paths(self):
+        self.bone_tools.EffectRot = True
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        name = lbt.GetNativeKeyingSetName(self.obj.name, "Arms")
+        built = lbt.NativeKeyingSetEffects[(self.scene.name, name)]
+
+        self.obj.pose.bones["Arm.L"].rotation_mode = 'XYZ'
+        pose_bones = lbt.GetCachedPoseBones(self.obj, self.bone_tools.CachedSelections[self.obj.name]["Arms"])
+        self.assertNotEqual(lbt.GetEffectsKey(self.bone_tools, pose_bones), built)
+
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        self.assertNativeMatchesStore()
+
+    def test_collection_visibility_keeps_bones_shown(self):
+        data = self.obj.data
+        hidden = data.collections.new("Hidden")
+        hidden.assign(data.bones["Arm.L"])
+        hidden.assign(data.bones["Arm.R"])
+        hidden.is_visible = False
+        before = {b.name: IsBoneShown(b) for b in data.bones}
+
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        # The arms stay hidden by their other collection, the legs stay shown through their cache collection
+        self.assertEqual({b.name: IsBoneShown(b) for b in data.bones}, before)
+        self.assertFalse(IsBoneShown(data.bones["Arm.L"]))
+        self.assertTrue(IsBoneShown(data.bones["Leg.L"]))
+
+    def test_sidecar_round_trip(self):
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        data = self.obj.data
+        ks = lbt.GetNativeKeyingSet(self.scene, lbt.GetNativeKeyingSetName(self.obj.name, "Arms"))
+        ks.paths.add(self.obj, lbt.GetBoneDataPath("Root", "location"), index=-1)
+        data.collections[lbt.GetNativeCollectionName("Legs")].assign(data.bones["Spine"])
+
+        store = self.bone_tools.CachedSelections[self.obj.name]
+        order = self.bone_tools.CachesOrder[self.obj.name]
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "Rig-LeetBoneToolsSelections.txt")
+            lbt.WriteSidecar(path, {self.obj.name: store}, {self.obj.name: order},
+                             {self.obj.name: lbt.GetRigFingerprint(self.obj)})
+            caches, orders, fingerprints = lbt.ReadSidecar(path)
+
+        # The edits to the native sets never reach the file, it holds exactly the cached selections
+        self.assertEqual(caches, {self.obj.name: store.ToDict()})
+        self.assertEqual(orders, {self.obj.name: list(order)})
+        self.assertEqual(fingerprints, {self.obj.name: lbt.GetRigFingerprint(self.obj)})
+
+        # Loading the file back and syncing rebuilds the native sets from it
+        self.bone_tools.CachedSelections[self.obj.name] = lbt.LeetRigCacheStore(caches[self.obj.name])
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        self.assertNativeMatchesStore()
+
+    def test_clear_keeps_store(self):
+        before = self.GetStoreSnapshot()
+        lbt.SyncNativeSets(self.context, self.bone_tools)
+        lbt.ClearNativeSets(self.context)
+        self.assertEqual(lbt.GetNativeCacheNames(self.scene, self.obj), set())
+        self.assertEqual(lbt.NativeKeyingSetEffects, {})
+        self.assertEqual(self.GetStoreSnapshot(), before)
+
+
+if __name__ == "__main__":
+    result = unittest.main(argv=[sys.argv[0]], exit=False).result
+    sys.exit(not result.wasSuccessful())